@@ -5,50 +5,189 @@ Frostband - Cross-Platform Wardriving Management Tool
 INSTALLATION:
     pip install requests cryptography
     Windows only: pip install pywin32
+    Optional (faster token encryption on Linux): pip install rfernet
+    Optional (faster JSON): pip install orjson
+    Optional (store the Linux encryption key in the OS keyring): pip install keyring
+    Optional (event-driven local file stats instead of polling): pip install watchdog
+    Optional (stream WiGLE uploads instead of buffering them): pip install requests-toolbelt
+    Optional (faster zip archiving): pip install zlib-ng
 """
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
-import subprocess, json, os, sys, base64, hashlib, tarfile, zipfile, requests
+import subprocess, json, os, re, sys, shlex, mmap, base64, hashlib, shutil, tarfile, zipfile, gzip, contextlib, platform, requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from datetime import datetime
-import threading
+from datetime import datetime, timedelta
+import threading, queue
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import webbrowser
 import tempfile
 
 
+class C:
+    """Dark mode color scheme"""
+    primary = '#3B82F6'         # Bright Blue
+    primary_dark = '#2563EB'
+    secondary = '#10B981'       # Green
+    accent = '#F59E0B'          # Amber
+    danger = '#EF4444'          # Red
+    bg = '#1E1E1E'              # Dark background
+    bg_secondary = '#2D2D2D'    # Slightly lighter
+    card = '#2D2D2D'            # Card background
+    border = '#404040'          # Border color
+    text = '#E0E0E0'            # Light text
+    text_secondary = '#A0A0A0'
+    input = '#3A3A3A'           # Entry/text field background
+
+
+# Frame of the dashboard's "Recent Activity" box
+BOX_TOP = "╔" + "═" * 80 + "╗"
+BOX_MID = "╠" + "═" * 80 + "╣"
+BOX_BOTTOM = "╚" + "═" * 80 + "╝"
+BOX_RECENT_HEADER = "║ Recent Uploads (Last 24 Hours)                                                ║"
+BOX_NO_UPLOADS = "║ No uploads in the last 24 hours                                               ║"
+
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB')
+RSYNC_PERCENT = re.compile(r'\s(\d{1,3})%\s')  # percentage column of rsync --info=progress2
+
+# Concurrent WiGLE uploads (direct upload also keeps pulling the next files from the Pi meanwhile)
+UPLOAD_WORKERS = 4
+
+WIGLE_UPLOAD_URL = "https://api.wigle.net/api/v2/file/upload"
+WIGLE_TX_URL = "https://api.wigle.net/api/v2/file/transactions"
+TX_PAGE = 100  # transactions per page when searching a date range
+KML_WORKERS = 8  # parallel KML downloads; matches the HTTP session's pool_maxsize
+
+# WiGLE API: (connect, read) timeout so a stalled connection can't hang a worker forever
+HTTP_TIMEOUT = (10, 60)
+UPLOAD_TIMEOUT = (10, 120)  # WiGLE answers an upload only after it has taken in the whole file
+
+# Button rows for the upload and transaction tabs: (label, method name, args, width, colour)
+UPLOAD_BUTTONS = (
+    ("Refresh list", "_refresh_upload_list", (), 15, C.primary),
+    ("Select All", "_check_all_uploads", (True,), 12, C.primary),
+    ("Select None", "_check_all_uploads", (False,), 12, C.primary),
+    ("Upload", "_upload_files", (), 12, C.secondary),
+    ("Delete", "_delete_local", (), 12, C.danger),
+    ("Archive", "_archive_local", (), 12, C.accent),
+)
+TX_BUTTONS = (
+    ("Select All", "_check_all_tx", (True,), 15, C.bg_secondary),
+    ("Select None", "_check_all_tx", (False,), 15, C.bg_secondary),
+    ("Download All New", "_tx_download_new", (), 18, C.accent),
+    ("Download Selected", "_tx_download_selected", (), 18, C.secondary),
+)
+
+# Auto-refresh: one timer tick; the slower WiGLE refresh runs every WIGLE_REFRESH_TICKS ticks
+TICK_MS = 5000
+LOG_MAX_LINES = 5000  # older lines are dropped from the RPi log so long runs keep redraws cheap
+UI_POLL_MS = 50  # how often the Tk thread drains UI updates queued by workers (see _ui)
+WIGLE_REFRESH_TICKS = 6  # 30 seconds
+
+# Notebook tab labels, in tab order (Dashboard, RPi, Upload, Transactions, Settings)
+TAB_LABELS = ("🏠 Dashboard", "📡 RPi Manager", "📤 WiGLE CSV", "📥 Transactions", "⚙️ Settings")
+
+
 class ToolTip:
     """Create a tooltip for a given widget"""
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
-        self.tooltip = None
+        # Built once and shown/hidden on hover instead of recreated every time
+        self.tooltip = tk.Toplevel(widget)
+        self.tooltip.wm_overrideredirect(True)
+        self.tooltip.withdraw()
+        tk.Label(self.tooltip, text=text, background=C.bg_secondary,
+                 foreground=C.text, relief="solid", borderwidth=1,
+                 font=("Segoe UI", 9), padx=8, pady=4).pack()
         self.widget.bind("<Enter>", self.show_tooltip)
         self.widget.bind("<Leave>", self.hide_tooltip)
     
     def show_tooltip(self, event=None):
-        x, y, _, _ = self.widget.bbox("insert")
-        x += self.widget.winfo_rootx() + 25
-        y += self.widget.winfo_rooty() + 25
-        
-        self.tooltip = tk.Toplevel(self.widget)
-        self.tooltip.wm_overrideredirect(True)
+        x = self.widget.winfo_rootx() + 25
+        y = self.widget.winfo_rooty() + 25
         self.tooltip.wm_geometry(f"+{x}+{y}")
-        
-        label = tk.Label(self.tooltip, text=self.text, background="#2D2D2D", 
-                        foreground="#E0E0E0", relief="solid", borderwidth=1,
-                        font=("Segoe UI", 9), padx=8, pady=4)
-        label.pack()
+        self.tooltip.deiconify()
     
     def hide_tooltip(self, event=None):
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        self.tooltip.withdraw()
+
+class LazyTree(ttk.Treeview):
+    """Treeview that inserts rows a page at a time as the user scrolls; rows not yet shown live in Python only"""
+    PAGE = 200
+
+    def __init__(self, master, scrollbar, columns, **kw):
+        self._sb, self._cols = scrollbar, tuple(columns)
+        self._rows, self._order, self._shown = {}, [], 0  # iid -> [index, {'text', 'values', 'tags'}]
+        super().__init__(master, columns=columns, yscrollcommand=self._on_scroll, **kw)
+        scrollbar.config(command=self.yview)
+
+    def load(self, rows, tags=()):
+        """Replace the contents with rows of column values, all starting with tags; returns their iids in order"""
+        self.delete(*self.get_children())
+        self._order = [f"r{i}" for i in range(len(rows))]
+        self._rows = {iid: [i, {'text': '', 'values': list(values), 'tags': tags}]
+                      for i, (iid, values) in enumerate(zip(self._order, rows))}
+        self._shown = 0
+        self._show_more()
+        return self._order
+
+    def _show_more(self):
+        end = min(self._shown + self.PAGE, len(self._order))
+        for iid in self._order[self._shown:end]:
+            super().insert('', 'end', iid=iid, **self._rows[iid][1])
+        self._shown = end
+
+    def _on_scroll(self, first, last):
+        self._sb.set(first, last)
+        if float(last) > 0.9 and self._shown < len(self._order): self.after_idle(self._show_more)
+
+    def _pending(self, item):
+        row = self._rows.get(item)
+        return row[1] if row is not None and row[0] >= self._shown else None
+
+    def item(self, item, option=None, **kw):
+        if (opts := self._pending(item)) is None: return super().item(item, option, **kw)
+        opts.update((k, kw[k]) for k in ('text', 'values', 'tags') if k in kw)
+        if option is not None: return opts.get(option)
+        if not kw: return dict(opts)
+
+    def retag(self, items, add, remove):
+        """Swap tag remove for add on many rows: two Tcl calls for the rows in Tk, dict updates for the rest"""
+        shown = []
+        for iid in items:
+            if (opts := self._pending(iid)) is None: shown.append(iid)
+            else: opts['tags'] = tuple(t for t in opts['tags'] if t != remove) + (add,)
+        if shown:
+            self.tk.call(self._w, 'tag', 'remove', remove, shown)
+            self.tk.call(self._w, 'tag', 'add', add, shown)
+
+    def set(self, item, column=None, value=None):
+        if (opts := self._pending(item)) is None: return super().set(item, column, value)
+        if column is None: return dict(zip(self._cols, opts['values']))
+        if value is None: return opts['values'][self._cols.index(column)]
+        opts['values'][self._cols.index(column)] = value
+
+
+def _checkbox_image(master, checked):
+    """13x13 checkbox glyph drawn in the palette colours (used as a Treeview tag image)"""
+    img = tk.PhotoImage(master=master, width=13, height=13)
+    img.put(C.text_secondary, to=(0, 0, 13, 13))
+    img.put(C.primary if checked else C.bg_secondary, to=(1, 1, 12, 12))
+    if checked:
+        for x, y in ((3, 6), (4, 7), (5, 8), (6, 7), (7, 6), (8, 5), (9, 4)):
+            img.put('white', to=(x, y, x + 1, y + 2))
+    return img
+
 
 if sys.platform == 'win32':
     try:
         import win32crypt
         USE_DPAPI = True
+        CRYPTPROTECT_UI_FORBIDDEN = 0x1  # never block on a DPAPI UI prompt
     except ImportError:
         USE_DPAPI = False
 else:
@@ -56,50 +195,329 @@ else:
 
 if not USE_DPAPI:
     try:
-        from cryptography.fernet import Fernet
+        import rfernet
+
+        class Fernet:
+            """Rust-backed Fernet exposing the bytes API of cryptography.fernet.Fernet"""
+            def __init__(self, key): self._f = rfernet.Fernet(key.decode())
+            @staticmethod
+            def generate_key(): return rfernet.Fernet.generate_new_key().encode()
+            def encrypt(self, data): return self._f.encrypt(data).encode()
+            def decrypt(self, token): return self._f.decrypt(token.decode())
     except ImportError:
-        print("ERROR: pip install cryptography")
-        sys.exit(1)
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError:
+            print("ERROR: pip install cryptography (or the faster: pip install rfernet)")
+            sys.exit(1)
+    try:
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    except ImportError:
+        AESGCM = None  # rfernet-only install: keep encrypting with Fernet
+    try:
+        import keyring, keyring.errors
+    except ImportError:
+        keyring = None
+
+FERNET_MAGIC = b'gAAAA'  # every (legacy) Fernet token starts with this
+
+
+class KeyUnavailableError(RuntimeError):
+    """The AES-GCM master key is in the keyring but can't be read right now (locked or busy backend)"""
+
+# Default data directories live next to the script; resolved once per process
+APP_DIR = Path(__file__).parent.resolve() if '__file__' in globals() else Path.cwd()
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    def _json_dumps(obj): return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj): return json.dumps(obj, indent=2).encode()
+
+# Non-interactive ssh/scp: fail fast instead of hanging a worker on a prompt or a dead host, and
+# keep the connection alive. On top, OpenSSH multiplexing lets later calls reuse one authenticated
+# connection for 60s (Win32-OpenSSH has no unix-socket ControlMaster, so it connects per call).
+SSH_OPTS = ['-o', 'BatchMode=yes', '-o', 'ConnectTimeout=5', '-o', 'ServerAliveInterval=15']
+if sys.platform != 'win32':
+    SSH_OPTS += ['-o', 'ControlMaster=auto', '-o', 'ControlPath=~/.ssh/frostband-%r@%h:%p', '-o', 'ControlPersist=60s']
+
+# Pi-side manifest of the NUL-separated paths on stdin: one hasher per core; each batch prints < PIPE_BUF so lines
+# can't interleave, and sort restores path order. b2sum (BLAKE2b) is several times faster than sha256sum on a Pi
+# without SHA instructions; older images fall back. MANIFEST_MEMBER is its name when it travels inside the tar stream.
+PI_HASH = 'H=$(command -v b2sum || echo sha256sum); xargs -0 -r -P "$(nproc)" -n 8 "$H" | sort -k 2'
+MANIFEST_MEMBER = '.frostband.sum'
+
+# Console tools spawned from the GUI get no console window on Windows (no flash, no focus steal)
+SUBPROC_KW = {'creationflags': subprocess.CREATE_NO_WINDOW} if sys.platform == 'win32' else {}
+
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+
+class DirWatcher:
+    """watchdog handler: calls on_change on the Tk thread, debounced, when files with the given suffixes come or go.
+    post(fn) must hand fn to the Tk thread; watchdog calls dispatch from its own thread."""
+    def __init__(self, root, post, suffixes, on_change, delay=250):
+        self.root, self.post, self.suffixes, self.on_change, self.delay = root, post, suffixes, on_change, delay
+        self._pending = None
+
+    def dispatch(self, event):
+        if event.event_type not in ('created', 'deleted', 'moved'): return
+        paths = (event.src_path, getattr(event, 'dest_path', '') or '')
+        if event.is_directory or any(p.endswith(self.suffixes) for p in paths):
+            self.post(self._debounce)
+
+    def _debounce(self):
+        if self._pending: self.root.after_cancel(self._pending)
+        self._pending = self.root.after(self.delay, self._fire)
+
+    def _fire(self):
+        self._pending = None
+        self.on_change()
+
+
+try:
+    from zlib_ng import zlib_ng
+    zipfile.zlib = zlib_ng  # SIMD deflate, same API and output format as zlib
+except ImportError:
+    pass
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+
+def _gzip_spool(src, level=3):
+    """gzip a path or readable file object into a rewound SpooledTemporaryFile (in RAM up to 8 MiB, then on disk)"""
+    spool = tempfile.SpooledTemporaryFile(max_size=8 << 20)
+    with (open(src, 'rb') if isinstance(src, (str, os.PathLike)) else contextlib.nullcontext(src)) as f, \
+         gzip.GzipFile(fileobj=spool, mode='wb', compresslevel=level) as gz:
+        shutil.copyfileobj(f, gz, 1 << 20)
+    spool.seek(0)
+    return spool
+
+
+def _iter_files(root, suffix):
+    """(path, size) of every file ending in suffix under root; DirEntry.stat needs no extra syscall on Windows"""
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False): stack.append(e.path)
+                    elif e.name.endswith(suffix): yield e.path, e.stat().st_size
+        except OSError: pass
+
+
+def _kml_ids(folder):
+    """Transaction ids that already have a .kml in folder, from one directory read instead of a stat per id"""
+    try:
+        with os.scandir(folder) as it: return {e.name[:-4] for e in it if e.name.endswith('.kml')}
+    except OSError: return set()
+
+
+def _file_digest(path, algo='sha256'):
+    """Hex digest of a file, hashed straight from a read-only mmap (no copy onto the Python heap)"""
+    h = hashlib.new(algo)
+    with open(path, 'rb', buffering=0) as f:
+        if os.fstat(f.fileno()).st_size:  # an empty file can't be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+    return h.hexdigest()
+
+
+def _askpass_helper(folder):
+    """Write an SSH_ASKPASS program into folder that prints $FROSTBAND_SSH_PASS; returns its path"""
+    if sys.platform == 'win32':
+        path = os.path.join(folder, 'askpass.cmd')
+        # delayed expansion prints the value verbatim, whatever &, ^ or quotes it holds
+        body = '@echo off\r\nsetlocal EnableDelayedExpansion\r\necho(!FROSTBAND_SSH_PASS!\r\n'
+    else:
+        path = os.path.join(folder, 'askpass')
+        body = '#!/bin/sh\nprintf \'%s\\n\' "$FROSTBAND_SSH_PASS"\n'
+    with open(path, 'w', newline='') as f: f.write(body)
+    os.chmod(path, 0o700)
+    return path
+
+
+def _wait_all(procs):
+    """Wait for every process of a pipeline; the first non-zero exit code, else 0"""
+    codes = [p.wait() for p in procs]
+    return next((c for c in codes if c), 0)
+
+
+_MADE_DIRS = set()  # directories already created/confirmed this process
+
+def _ensure_dir(*paths):
+    for p in paths:
+        if (s := str(p)) not in _MADE_DIRS:
+            Path(p).mkdir(parents=True, exist_ok=True)
+            _MADE_DIRS.add(s)
 
 
 class ConfigManager:
     def __init__(self):
         base = Path(os.environ.get('APPDATA', Path.home())) if sys.platform == 'win32' else Path.home() / '.config'
         self.config_dir = base / 'Frostband'
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.config_dir)
         self.config_file, self.key_file = self.config_dir / "frostband_config.json", self.config_dir / "frostband.key"
+        self.gcm_key_file = self.config_dir / "frostband_gcm.key"
+        self._key_bytes, self._fernet = None, None
+        self._cached_config = None
+        self._saved_bytes = None  # exact bytes of this process's last save_config
+        self._gcm_key, self._gcm = None, None
+        self._cipher_lock = threading.Lock()  # workers decrypt too; two first calls must not both generate a key
+        if not USE_DPAPI: self._check_aesni()
+    
+    def _check_aesni(self):
+        """Warn if token AES will run on OpenSSL's software path instead of AES-NI"""
+        if platform.machine().lower() not in ('x86_64', 'amd64', 'i386', 'i686', 'x86'): return
+        reason = None
+        # OPENSSL_ia32cap=[~]cap1[:...]; AES-NI is bit 57 of the first capability word
+        cap = os.environ.get('OPENSSL_ia32cap', '').split(':')[0].strip()
+        if cap:
+            try:
+                if bool(int(cap.lstrip('~'), 0) >> 57 & 1) == cap.startswith('~'):
+                    reason = f"disabled by OPENSSL_ia32cap={cap}"
+            except ValueError: pass
+        if not reason and sys.platform.startswith('linux'):
+            try:
+                with open('/proc/cpuinfo') as f: flags = next((l for l in f if l.startswith('flags')), '')
+                if flags and 'aes' not in flags.split(): reason = "CPU does not report the 'aes' flag"
+            except OSError: pass
+        if reason: print(f"WARNING: AES-NI unavailable ({reason}); token encryption uses software AES")
     
     def _get_fernet_key(self):
-        if self.key_file.exists(): return self.key_file.read_bytes()
+        if self._key_bytes is not None: return self._key_bytes
+        try:
+            self._key_bytes = self.key_file.read_bytes()
+            return self._key_bytes
+        except FileNotFoundError: pass
         key = Fernet.generate_key()
         self.key_file.write_bytes(key)
         os.chmod(self.key_file, 0o600)
+        self._key_bytes = key
+        return key
+    
+    def _fernet_cipher(self):
+        """Build the Fernet cipher once per process and reuse it for every token op"""
+        if self._fernet is None:
+            with self._cipher_lock:
+                if self._fernet is None: self._fernet = Fernet(self._get_fernet_key())
+        return self._fernet
+    
+    def _get_gcm_key(self):
+        """256-bit AES-GCM key: OS keyring when available, else a 0600 key file"""
+        if self._gcm_key is not None: return self._gcm_key
+        try:
+            self._gcm_key = self.gcm_key_file.read_bytes()
+            return self._gcm_key
+        except FileNotFoundError: pass
+        stored, use_keyring = None, keyring is not None
+        if use_keyring:
+            try: stored = keyring.get_password('Frostband', 'master')
+            except keyring.errors.NoKeyringError: use_keyring = False  # no backend on this system: key file only
+            except Exception as e:
+                # A locked or busy backend may still hold the real key: minting a new one would orphan every saved secret
+                raise KeyUnavailableError(f"keyring read failed, not replacing the master key: {e}") from e
+        if stored:
+            self._gcm_key = base64.b64decode(stored)
+            return self._gcm_key
+        key = AESGCM.generate_key(bit_length=256)
+        if use_keyring:
+            try: keyring.set_password('Frostband', 'master', base64.b64encode(key).decode())
+            except Exception: use_keyring = False  # backend refused the write: keep the fresh key in the file instead
+        if not use_keyring:
+            self.gcm_key_file.write_bytes(key)
+            os.chmod(self.gcm_key_file, 0o600)
+        self._gcm_key = key
         return key
     
+    def _gcm_cipher(self):
+        if self._gcm is None:
+            with self._cipher_lock:
+                if self._gcm is None: self._gcm = AESGCM(self._get_gcm_key())
+        return self._gcm
+    
+    def _is_legacy(self, e):
+        """True for a stored Fernet token that should be re-encrypted with AES-GCM"""
+        if not e or USE_DPAPI or AESGCM is None: return False
+        try: return base64.b64decode(e)[:len(FERNET_MAGIC)] == FERNET_MAGIC
+        except ValueError: return False
+    
+    def _dpapi_protect(self, data):
+        try: return win32crypt.CryptProtectData(data, None, None, None, None, CRYPTPROTECT_UI_FORBIDDEN)
+        except Exception: return win32crypt.CryptProtectData(data, None, None, None, None, 0)
+    
+    def _dpapi_unprotect(self, blob):
+        try: return win32crypt.CryptUnprotectData(blob, None, None, None, CRYPTPROTECT_UI_FORBIDDEN)[1]
+        except Exception: return win32crypt.CryptUnprotectData(blob, None, None, None, 0)[1]
+    
     def encrypt_token(self, p):
         if not p: return ""
-        if USE_DPAPI: return base64.b64encode(win32crypt.CryptProtectData(p.encode(), None, None, None, None, 0)).decode()
-        return base64.b64encode(Fernet(self._get_fernet_key()).encrypt(p.encode())).decode()
+        if USE_DPAPI: return base64.b64encode(self._dpapi_protect(p.encode())).decode()
+        if AESGCM is None: return base64.b64encode(self._fernet_cipher().encrypt(p.encode())).decode()
+        nonce = os.urandom(12)
+        return base64.b64encode(nonce + self._gcm_cipher().encrypt(nonce, p.encode(), None)).decode()
     
     def decrypt_token(self, e):
         if not e: return ""
         try:
-            if USE_DPAPI: return win32crypt.CryptUnprotectData(base64.b64decode(e), None, None, None, 0)[1].decode()
-            return Fernet(self._get_fernet_key()).decrypt(base64.b64decode(e)).decode()
+            raw = base64.b64decode(e)
+            if USE_DPAPI: return self._dpapi_unprotect(raw).decode()
+            if AESGCM is None or raw[:len(FERNET_MAGIC)] == FERNET_MAGIC: return self._fernet_cipher().decrypt(raw).decode()
+            return self._gcm_cipher().decrypt(raw[:12], raw[12:], None).decode()
+        except KeyUnavailableError: raise  # not a bad token: the caller must not treat it as an empty one
         except: return ""
     
+    def encrypt_secrets(self, secrets):
+        """Encrypt every secret field as one JSON blob, so N secrets cost a single cipher op"""
+        s = {k: v for k, v in secrets.items() if v}
+        return self.encrypt_token(json.dumps(s)) if s else ""
+    
+    def decrypt_secrets(self, e):
+        """Decrypt the secrets blob back into a dict ({} if missing or unreadable)"""
+        try: return _json_loads(self.decrypt_token(e) or '{}')
+        except ValueError: return {}
+    
     def load_config(self):
-        d = {'wigle_api_id': '', 'wigle_api_token_enc': '', 'pi_host': '', 'pi_user': '', 'pi_dir': '', 'win_dir': '', 'wigle_out_dir': ''}
-        if self.config_file.exists():
-            try: d.update(json.load(open(self.config_file)))
-            except: pass
-        ab = Path(__file__).parent.absolute() if '__file__' in globals() else Path.cwd()
-        if not d['win_dir']: d['win_dir'] = str(ab / 'Kismet')
-        if not d['wigle_out_dir']: d['wigle_out_dir'] = str(ab / 'WiGLE_Output')
+        if self._cached_config is not None: return dict(self._cached_config)
+        d = {'wigle_api_id': '', 'secrets_enc': '', 'pi_host': '', 'pi_user': '', 'pi_dir': '', 'win_dir': '', 'wigle_out_dir': ''}
+        try: d.update(_json_loads(self.config_file.read_bytes()))
+        except: pass  # missing (first run) or unreadable config: keep the defaults
+        postponed = False
+        try:
+            # Migrate the old per-field token into the batched secrets blob (persisted on next save)
+            if (legacy := d.get('wigle_api_token_enc', '')) and not d['secrets_enc']:
+                d['secrets_enc'] = self.encrypt_secrets({'wigle_api_token': self.decrypt_token(legacy)})
+            d.pop('wigle_api_token_enc', None)
+            # Likewise move Fernet-encrypted secrets over to AES-GCM
+            if self._is_legacy(d['secrets_enc']):
+                d['secrets_enc'] = self.encrypt_secrets(self.decrypt_secrets(d['secrets_enc']))
+        except KeyUnavailableError as e:
+            postponed = True  # keep the legacy blobs as they are; the next load tries again
+            print(f"Secrets migration postponed: {e}")
+        if not d['win_dir']: d['win_dir'] = str(APP_DIR / 'Kismet')
+        if not d['wigle_out_dir']: d['wigle_out_dir'] = str(APP_DIR / 'WiGLE_Output')
+        if not postponed: self._cached_config = dict(d)
         return d
     
     def save_config(self, c):
-        json.dump(c, open(self.config_file, 'w'), indent=2)
+        data = _json_dumps(c)
+        if data == self._saved_bytes: return  # unchanged since our last write: skip the write + fsync
+        # Write a temp file and rename it over the config so a crash never leaves a torn file
+        tmp = self.config_file.with_suffix('.json.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.config_file)
+        self._cached_config, self._saved_bytes = dict(c), data
 
 
 class FrostbandApp:
@@ -107,44 +525,110 @@ class FrostbandApp:
         self.root = root
         root.title("Frostband")
         root.geometry("1200x900")
-        
-        # Dark mode color scheme
-        self.colors = {
-            'primary': '#3B82F6',      # Bright Blue
-            'primary_dark': '#2563EB',
-            'secondary': '#10B981',    # Green
-            'accent': '#F59E0B',       # Amber
-            'danger': '#EF4444',       # Red
-            'bg': '#1E1E1E',          # Dark background
-            'bg_secondary': '#2D2D2D', # Slightly lighter
-            'card': '#2D2D2D',        # Card background
-            'border': '#404040',      # Border color
-            'text': '#E0E0E0',        # Light text
-            'text_secondary': '#A0A0A0'
-        }
-        
-        root.configure(bg=self.colors['bg'])
+        root.configure(bg=C.bg)
         
         self.config_mgr = ConfigManager()
         self.config = self.config_mgr.load_config()
+
+        # One pooled HTTP session for every WiGLE API call (keep-alive instead of a TLS handshake per request);
+        # the pool holds a connection per concurrent worker plus the dashboard so none is dropped and re-opened.
+        # Rate limiting (429) is retried after the server's Retry-After; POSTs are never replayed by urllib3.
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(KML_WORKERS, UPLOAD_WORKERS) + 2,
+                              max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504]))
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+        root.protocol('WM_DELETE_WINDOW', self._on_close)
+
+        # Reusable worker pool for SSH/network/file-IO so the Tk thread never blocks
+        self._jobs = queue.Queue()
+        for i in range(4):
+            threading.Thread(target=self._worker, name=f'fb-worker-{i}', daemon=True).start()
         self.upload_checks, self.tx_checks = {}, {}
 
         # Track file counts for change detection
         self.last_local_count = 0
         self.last_pi_count = 0
         self.last_archive_count = 0
-
-        Path(self.config['win_dir']).mkdir(parents=True, exist_ok=True)
-        Path(self.config['wigle_out_dir']).mkdir(parents=True, exist_ok=True)
+        # Per-directory scan cache for _scan_dir_cached: (path, suffix) -> (mtime_ns, count, size, subdirs)
+        self._dir_mtime_cache = {}
+        self._observer = None  # watchdog Observer on win_dir, see _start_watcher
+        self._token_cache = (None, '')  # (secrets_enc, plaintext token), see _get_wigle_token
+        self._token_lock = threading.Lock()
+        self._wigle_inflight = False
+        self._upload_scan = None  # token of the newest _refresh_upload_list scan
+        self._upload_rows = None  # rows the upload tree was last loaded with
+        self._tx_pages = {}  # pagestart -> (ETag, results) of WiGLE transaction pages, see _tx_page
+        self.dash = {}  # dashboard label StringVars by name, filled by _dash_var
+        self._log_buffer, self._log_scheduled = deque(), False
+        self._status_text, self._status_scheduled = "", False
+        self._ui_q = queue.Queue()  # (fn, args) from worker threads, run on the Tk thread by _drain_ui_queue
+
+        _ensure_dir(self.config['win_dir'], self.config['wigle_out_dir'])
         self._apply_styles()
+        self._img_checked, self._img_unchecked = _checkbox_image(root, True), _checkbox_image(root, False)
         self._create_widgets()
-        self._refresh_upload_list()
-        self._update_pi_status()
         self._refresh_dashboard()
+        self._drain_ui_queue()
 
         # Start auto-refresh timers
         self._schedule_auto_refresh()
     
+    def _on_close(self):
+        self._stop_watcher()
+        self.http.close()
+        if 'ControlMaster=auto' in SSH_OPTS:  # close the shared ssh master now rather than after ControlPersist
+            subprocess.Popen(['ssh', *SSH_OPTS, '-O', 'exit', f"{self.config['pi_user']}@{self.config['pi_host']}"],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **SUBPROC_KW)
+        self.root.destroy()
+
+    def _start_watcher(self):
+        """Watch win_dir for wiglecsv/zip changes (if watchdog is installed) instead of rescanning it every tick"""
+        self._stop_watcher()
+        if Observer is None: return
+        try:
+            self._observer = Observer()
+            self._observer.schedule(DirWatcher(self.root, self._ui, ('.wiglecsv', '.zip'), self._refresh_local_stats),
+                                    self.config['win_dir'], recursive=True)
+            self._observer.daemon = True
+            self._observer.start()
+        except Exception as e:
+            print(f"File watcher unavailable, polling instead: {e}")
+            self._observer = None
+
+    def _stop_watcher(self):
+        if self._observer:
+            self._observer.stop()
+            self._observer = None
+    
+    def _worker(self):
+        while True:
+            fut, fn, args = self._jobs.get()
+            if not fut.set_running_or_notify_cancel(): continue
+            try: fut.set_result(fn(*args))
+            except BaseException as e: fut.set_exception(e)
+    
+    def _submit(self, fn, *args, on_done=None):
+        """Run fn(*args) on the worker pool; on_done(future), if given, runs on the Tk thread"""
+        fut = Future()
+        if on_done: fut.add_done_callback(lambda f: self._ui(on_done, f))
+        self._jobs.put((fut, fn, args))
+        return fut
+
+    def _ui(self, fn, *args):
+        """Queue fn(*args) to run on the Tk thread; the only way worker threads touch widgets"""
+        self._ui_q.put((fn, args))
+
+    def _drain_ui_queue(self):
+        try:
+            while True:
+                fn, args = self._ui_q.get_nowait()
+                try: fn(*args)
+                except Exception: self.root.report_callback_exception(*sys.exc_info())  # Tk's normal error reporting, traceback included
+        except queue.Empty:
+            pass
+        self.root.after(UI_POLL_MS, self._drain_ui_queue)
+    
     def _apply_styles(self):
         """Apply dark mode styling to the application"""
         style = ttk.Style()
@@ -152,231 +636,243 @@ class FrostbandApp:
         
         # Configure Notebook (tabs) with dark theme
         style.configure('TNotebook', 
-                       background=self.colors['bg'], 
+                       background=C.bg, 
                        borderwidth=0)
         style.configure('TNotebook.Tab', 
-                       background=self.colors['bg_secondary'],
-                       foreground=self.colors['text'],
+                       background=C.bg_secondary,
+                       foreground=C.text,
                        padding=[20, 10],
                        borderwidth=0,
                        font=('Segoe UI', 10, 'bold'))
         style.map('TNotebook.Tab',
-                 background=[('selected', self.colors['primary'])],
+                 background=[('selected', C.primary)],
                  foreground=[('selected', 'white')],
                  expand=[('selected', [1, 1, 1, 0])])
         
         # Configure Frame
-        style.configure('TFrame', background=self.colors['bg'])
-        style.configure('Card.TFrame', background=self.colors['card'])
+        style.configure('TFrame', background=C.bg)
+        style.configure('Card.TFrame', background=C.card)
         
         # Configure LabelFrame with dark theme
         style.configure('TLabelframe', 
-                       background=self.colors['card'],
-                       bordercolor=self.colors['border'],
+                       background=C.card,
+                       bordercolor=C.border,
                        borderwidth=2,
                        relief='solid')
         style.configure('TLabelframe.Label', 
-                       background=self.colors['card'],
-                       foreground=self.colors['primary'],
+                       background=C.card,
+                       foreground=C.primary,
                        font=('Segoe UI', 9, 'bold'))
         
+        # Configure Entry (see _entry)
+        style.configure('Dark.TEntry',
+                       fieldbackground=C.input,
+                       foreground=C.text,
+                       insertcolor=C.primary,
+                       bordercolor=C.primary,
+                       lightcolor=C.primary,
+                       darkcolor=C.primary,
+                       borderwidth=2)
+        
         # Configure Progressbar
         style.configure('TProgressbar', 
-                       background=self.colors['secondary'],
-                       troughcolor=self.colors['bg_secondary'],
+                       background=C.secondary,
+                       troughcolor=C.bg_secondary,
                        borderwidth=0,
                        thickness=20)
+        
+        # Dark theme for treeview (shared by the upload and transaction tabs)
+        style.configure("Treeview", 
+                       background=C.bg_secondary,
+                       foreground=C.text,
+                       fieldbackground=C.bg_secondary,
+                       borderwidth=0)
+        style.configure("Treeview.Heading",
+                       background=C.primary,
+                       foreground='white',
+                       borderwidth=0)
+        style.map('Treeview', background=[('selected', C.primary)])
+
+        # Dashboard stat cards: label colours come from the option database instead of per-widget kwargs
+        self.root.option_add('*StatCard.Label.background', C.bg_secondary)
+        self.root.option_add('*StatCard.Label.foreground', C.text_secondary)
+    
+    def _card(self, parent):
+        """Dashboard stat card; its labels take bg/fg from the StatCard option-database defaults"""
+        return tk.Frame(parent, class_='StatCard', bg=C.bg_secondary, relief='flat', bd=0)
+
+    def _entry(self, parent, width, **kw):
+        """Dark-themed entry; all styling comes from the shared Dark.TEntry style"""
+        return ttk.Entry(parent, width=width, style='Dark.TEntry', **kw)
     
     def _create_widgets(self):
-        nb = ttk.Notebook(self.root)
+        self.nb = nb = ttk.Notebook(self.root)
         nb.pack(fill='both', expand=True, padx=10, pady=10)
-        self.tab_main, self.tab_rpi, self.tab_upload, self.tab_tx, self.tab_settings = [ttk.Frame(nb) for _ in range(5)]
-
-        # Configure tab backgrounds
-        for tab in [self.tab_main, self.tab_rpi, self.tab_upload, self.tab_tx, self.tab_settings]:
-            tab.configure(style='Card.TFrame')
-
-        for tab, txt in zip([self.tab_main, self.tab_rpi, self.tab_upload, self.tab_tx, self.tab_settings],
-                           ["🏠 Dashboard", "📡 RPi Manager", "📤 WiGLE CSV", "📥 Transactions", "⚙️ Settings"]):
+        self._tabs = [ttk.Frame(nb, style='Card.TFrame') for _ in TAB_LABELS]
+        self.tab_main, self.tab_rpi, self.tab_upload, self.tab_tx, self.tab_settings = self._tabs
+        for tab, txt in zip(self._tabs, TAB_LABELS):
             nb.add(tab, text=txt)
         self.progress = ttk.Progressbar(self.root)
         self.progress.pack(fill='x', padx=10, pady=(0,5))
         self.status_label = tk.Label(self.root, text="Ready.", anchor='w')
         self.status_label.pack(fill='x', padx=10, pady=(0,10))
-        self._build_main_tab()
-        self._build_settings_tab()
-        self._build_rpi_tab()
-        self._build_upload_tab()
-        self._build_tx_tab()
+
+        # Only the dashboard is visible on open; the other tabs are built on first selection
+        self._tab_builders = {self.tab_main: self._build_main_tab, self.tab_rpi: self._build_rpi_tab,
+                              self.tab_upload: self._build_upload_tab, self.tab_tx: self._build_tx_tab,
+                              self.tab_settings: self._build_settings_tab}
+        self._tab_built = {tab: False for tab in self._tab_builders}
+        self._ensure_tab(self.tab_main)
+        nb.bind('<<NotebookTabChanged>>', self._on_tab_change)
+
+    def _on_tab_change(self, e):
+        self._ensure_tab(self.nb.nametowidget(self.nb.select()))
+
+    def _ensure_tab(self, tab):
+        """Build a tab's widgets the first time they are needed"""
+        if self._tab_built[tab]: return
+        self._tab_built[tab] = True
+        self._tab_builders[tab]()
+        if tab is self.tab_rpi: self._update_pi_status()
+        elif tab is self.tab_upload: self._refresh_upload_list()
+
+    def _dash_var(self, name):
+        """StringVar behind a dashboard value label, registered in self.dash under name"""
+        var = self.dash[name] = tk.StringVar(self.root, value="—")
+        return var
 
     def _build_main_tab(self):
         f = self.tab_main
 
         # Header
-        header_frame = tk.Frame(f, bg=self.colors['card'])
+        header_frame = tk.Frame(f, bg=C.card)
         header_frame.pack(fill='x', padx=15, pady=(15,10))
         tk.Label(header_frame, text="🏠 Frostband Dashboard",
-                bg=self.colors['card'], fg=self.colors['text'], font=('Segoe UI', 14, 'bold'),
+                bg=C.card, fg=C.text, font=('Segoe UI', 14, 'bold'),
                 anchor='w').pack(fill='x')
         tk.Label(header_frame, text="Quick overview and status monitoring",
-                bg=self.colors['card'], fg=self.colors['text_secondary'], font=('Segoe UI', 9),
+                bg=C.card, fg=C.text_secondary, font=('Segoe UI', 9),
                 anchor='w').pack(fill='x')
 
         # WiGLE Stats Section (moved to top)
-        wigle_stats_section = tk.Frame(f, bg=self.colors['card'])
+        wigle_stats_section = tk.Frame(f, bg=C.card)
         wigle_stats_section.pack(fill='x', padx=15, pady=10)
 
         tk.Label(wigle_stats_section, text="WiGLE Statistics",
-                bg=self.colors['card'], fg=self.colors['text'],
+                bg=C.card, fg=C.text,
                 font=('Segoe UI', 11, 'bold')).pack(anchor='w', pady=(0,10))
 
         # WiGLE stats cards container
-        wigle_stats_row = tk.Frame(wigle_stats_section, bg=self.colors['card'])
+        wigle_stats_row = tk.Frame(wigle_stats_section, bg=C.card)
         wigle_stats_row.pack(fill='x', pady=(0,10))
 
         # WiFi Discovered Card
-        wifi_card = tk.Frame(wigle_stats_row, bg=self.colors['bg_secondary'], relief='flat', bd=0)
+        wifi_card = self._card(wigle_stats_row)
         wifi_card.pack(side='left', fill='both', expand=True, padx=(0,10))
-        tk.Label(wifi_card, text="📶 WiFi Discovered", bg=self.colors['bg_secondary'],
-                fg=self.colors['text_secondary'], font=('Segoe UI', 9)).pack(pady=(10,5))
-        self.dash_wifi_discovered = tk.Label(wifi_card, text="—",
-                                             bg=self.colors['bg_secondary'], fg=self.colors['primary'],
-                                             font=('Segoe UI', 20, 'bold'))
-        self.dash_wifi_discovered.pack(pady=(0,5))
-        self.dash_wifi_detail = tk.Label(wifi_card, text="—",
-                                         bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
-                                         font=('Segoe UI', 8))
-        self.dash_wifi_detail.pack(pady=(0,10))
+        tk.Label(wifi_card, text="📶 WiFi Discovered", font=('Segoe UI', 9)).pack(pady=(10,5))
+        tk.Label(wifi_card, textvariable=self._dash_var('wifi_discovered'), fg=C.primary,
+                 font=('Segoe UI', 20, 'bold')).pack(pady=(0,5))
+        tk.Label(wifi_card, textvariable=self._dash_var('wifi_detail'), font=('Segoe UI', 8)).pack(pady=(0,10))
 
         # Monthly Rank Card
-        monthly_rank_card = tk.Frame(wigle_stats_row, bg=self.colors['bg_secondary'], relief='flat', bd=0)
+        monthly_rank_card = self._card(wigle_stats_row)
         monthly_rank_card.pack(side='left', fill='both', expand=True, padx=(0,10))
-        tk.Label(monthly_rank_card, text="📅 Monthly Rank", bg=self.colors['bg_secondary'],
-                fg=self.colors['text_secondary'], font=('Segoe UI', 9)).pack(pady=(10,5))
-        self.dash_monthly_rank = tk.Label(monthly_rank_card, text="—",
-                                         bg=self.colors['bg_secondary'], fg=self.colors['secondary'],
-                                         font=('Segoe UI', 20, 'bold'))
-        self.dash_monthly_rank.pack(pady=(0,5))
-        self.dash_monthly_detail = tk.Label(monthly_rank_card, text="—",
-                                           bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
-                                           font=('Segoe UI', 8))
-        self.dash_monthly_detail.pack(pady=(0,10))
+        tk.Label(monthly_rank_card, text="📅 Monthly Rank", font=('Segoe UI', 9)).pack(pady=(10,5))
+        tk.Label(monthly_rank_card, textvariable=self._dash_var('monthly_rank'), fg=C.secondary,
+                 font=('Segoe UI', 20, 'bold')).pack(pady=(0,5))
+        tk.Label(monthly_rank_card, textvariable=self._dash_var('monthly_detail'), font=('Segoe UI', 8)).pack(pady=(0,10))
 
         # Overall Rank Card
-        overall_rank_card = tk.Frame(wigle_stats_row, bg=self.colors['bg_secondary'], relief='flat', bd=0)
+        overall_rank_card = self._card(wigle_stats_row)
         overall_rank_card.pack(side='left', fill='both', expand=True)
-        tk.Label(overall_rank_card, text="🏆 Overall Rank", bg=self.colors['bg_secondary'],
-                fg=self.colors['text_secondary'], font=('Segoe UI', 9)).pack(pady=(10,5))
-        self.dash_overall_rank = tk.Label(overall_rank_card, text="—",
-                                         bg=self.colors['bg_secondary'], fg=self.colors['accent'],
-                                         font=('Segoe UI', 20, 'bold'))
-        self.dash_overall_rank.pack(pady=(0,5))
-        self.dash_overall_detail = tk.Label(overall_rank_card, text="—",
-                                           bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
-                                           font=('Segoe UI', 8))
-        self.dash_overall_detail.pack(pady=(0,10))
+        tk.Label(overall_rank_card, text="🏆 Overall Rank", font=('Segoe UI', 9)).pack(pady=(10,5))
+        tk.Label(overall_rank_card, textvariable=self._dash_var('overall_rank'), fg=C.accent,
+                 font=('Segoe UI', 20, 'bold')).pack(pady=(0,5))
+        tk.Label(overall_rank_card, textvariable=self._dash_var('overall_detail'), font=('Segoe UI', 8)).pack(pady=(0,10))
 
         # Recent Uploads Section
-        recent_section = tk.Frame(f, bg=self.colors['card'])
+        recent_section = tk.Frame(f, bg=C.card)
         recent_section.pack(fill='x', padx=15, pady=10)
 
         tk.Label(recent_section, text="📊 Recent Activity",
-                bg=self.colors['card'], fg=self.colors['text'],
+                bg=C.card, fg=C.text,
                 font=('Segoe UI', 11, 'bold')).pack(anchor='w', pady=(0,10))
 
         # Recent uploads container with scrollable text area
-        recent_container = tk.Frame(recent_section, bg=self.colors['bg_secondary'], relief='flat', bd=2)
+        recent_container = tk.Frame(recent_section, bg=C.bg_secondary, relief='flat', bd=2)
         recent_container.pack(fill='both', expand=True)
 
         self.dash_recent_text = scrolledtext.ScrolledText(recent_container, height=8, width=100,
-                                                           bg=self.colors['bg_secondary'], fg=self.colors['text'],
-                                                           insertbackground=self.colors['text'], relief='flat',
+                                                           bg=C.bg_secondary, fg=C.text,
+                                                           insertbackground=C.text, relief='flat',
                                                            font=('Consolas', 9), borderwidth=0, wrap='word')
         self.dash_recent_text.pack(fill='both', expand=True, padx=10, pady=10)
         self.dash_recent_text.config(state='disabled')
 
         # Quick Stats Section
-        stats_section = tk.Frame(f, bg=self.colors['card'])
+        stats_section = tk.Frame(f, bg=C.card)
         stats_section.pack(fill='x', padx=15, pady=10)
 
         tk.Label(stats_section, text="Quick Stats",
-                bg=self.colors['card'], fg=self.colors['text'],
+                bg=C.card, fg=C.text,
                 font=('Segoe UI', 11, 'bold')).pack(anchor='w', pady=(0,10))
 
         # Stats cards container
-        stats_row1 = tk.Frame(stats_section, bg=self.colors['card'])
+        stats_row1 = tk.Frame(stats_section, bg=C.card)
         stats_row1.pack(fill='x', pady=(0,10))
 
         # Local Files Card
-        local_card = tk.Frame(stats_row1, bg=self.colors['bg_secondary'], relief='flat', bd=0)
+        local_card = self._card(stats_row1)
         local_card.pack(side='left', fill='both', expand=True, padx=(0,10))
-        tk.Label(local_card, text="📁 Local Files", bg=self.colors['bg_secondary'],
-                fg=self.colors['text_secondary'], font=('Segoe UI', 9)).pack(pady=(10,5))
-        self.dash_local_count = tk.Label(local_card, text="—",
-                                         bg=self.colors['bg_secondary'], fg=self.colors['primary'],
-                                         font=('Segoe UI', 20, 'bold'))
-        self.dash_local_count.pack(pady=(0,5))
-        self.dash_local_size = tk.Label(local_card, text="—",
-                                        bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
-                                        font=('Segoe UI', 8))
-        self.dash_local_size.pack(pady=(0,10))
+        tk.Label(local_card, text="📁 Local Files", font=('Segoe UI', 9)).pack(pady=(10,5))
+        tk.Label(local_card, textvariable=self._dash_var('local_count'), fg=C.primary,
+                 font=('Segoe UI', 20, 'bold')).pack(pady=(0,5))
+        tk.Label(local_card, textvariable=self._dash_var('local_size'), font=('Segoe UI', 8)).pack(pady=(0,10))
 
         # Pi Files Card
-        pi_files_card = tk.Frame(stats_row1, bg=self.colors['bg_secondary'], relief='flat', bd=0)
+        pi_files_card = self._card(stats_row1)
         pi_files_card.pack(side='left', fill='both', expand=True, padx=(0,10))
-        tk.Label(pi_files_card, text="📡 Pi Files", bg=self.colors['bg_secondary'],
-                fg=self.colors['text_secondary'], font=('Segoe UI', 9)).pack(pady=(10,5))
-        self.dash_pi_count = tk.Label(pi_files_card, text="—",
-                                      bg=self.colors['bg_secondary'], fg=self.colors['secondary'],
-                                      font=('Segoe UI', 20, 'bold'))
-        self.dash_pi_count.pack(pady=(0,5))
-        self.dash_pi_size = tk.Label(pi_files_card, text="—",
-                                     bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
-                                     font=('Segoe UI', 8))
-        self.dash_pi_size.pack(pady=(0,10))
+        tk.Label(pi_files_card, text="📡 Pi Files", font=('Segoe UI', 9)).pack(pady=(10,5))
+        tk.Label(pi_files_card, textvariable=self._dash_var('pi_count'), fg=C.secondary,
+                 font=('Segoe UI', 20, 'bold')).pack(pady=(0,5))
+        tk.Label(pi_files_card, textvariable=self._dash_var('pi_size'), font=('Segoe UI', 8)).pack(pady=(0,10))
 
         # Archives Card
-        archive_card = tk.Frame(stats_row1, bg=self.colors['bg_secondary'], relief='flat', bd=0)
+        archive_card = self._card(stats_row1)
         archive_card.pack(side='left', fill='both', expand=True)
-        tk.Label(archive_card, text="📦 Archives", bg=self.colors['bg_secondary'],
-                fg=self.colors['text_secondary'], font=('Segoe UI', 9)).pack(pady=(10,5))
-        self.dash_archive_count = tk.Label(archive_card, text="—",
-                                           bg=self.colors['bg_secondary'], fg=self.colors['accent'],
-                                           font=('Segoe UI', 20, 'bold'))
-        self.dash_archive_count.pack(pady=(0,5))
-        self.dash_archive_size = tk.Label(archive_card, text="—",
-                                          bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
-                                          font=('Segoe UI', 8))
-        self.dash_archive_size.pack(pady=(0,10))
+        tk.Label(archive_card, text="📦 Archives", font=('Segoe UI', 9)).pack(pady=(10,5))
+        tk.Label(archive_card, textvariable=self._dash_var('archive_count'), fg=C.accent,
+                 font=('Segoe UI', 20, 'bold')).pack(pady=(0,5))
+        tk.Label(archive_card, textvariable=self._dash_var('archive_size'), font=('Segoe UI', 8)).pack(pady=(0,10))
 
         # Quick Actions Section
-        actions_section = tk.Frame(f, bg=self.colors['card'])
+        actions_section = tk.Frame(f, bg=C.card)
         actions_section.pack(fill='x', padx=15, pady=10)
 
         tk.Label(actions_section, text="⚡ Quick Actions",
-                bg=self.colors['card'], fg=self.colors['text'],
+                bg=C.card, fg=C.text,
                 font=('Segoe UI', 11, 'bold')).pack(anchor='w', pady=(0,10))
 
         # Action buttons container
-        actions_container = tk.Frame(actions_section, bg=self.colors['card'])
+        actions_container = tk.Frame(actions_section, bg=C.card)
         actions_container.pack(fill='x')
 
         # Big action buttons
         self.dash_btn_automatic = tk.Button(actions_container, text="🚀 Automatic Sync\nStop → Copy → Verify → Delete",
                                              command=self._automatic, height=3,
-                                             bg=self.colors['secondary'], fg='white', relief='flat',
+                                             bg=C.secondary, fg='white', relief='flat',
                                              cursor='hand2', font=('Segoe UI', 10, 'bold'))
         self.dash_btn_automatic.pack(side='left', fill='both', expand=True, padx=(0,10))
 
         self.dash_btn_upload = tk.Button(actions_container, text="📤 Upload Direct to WiGLE\nUpload from Pi to WiGLE",
                                           command=self._upload_direct_to_wigle,
-                                          height=3, bg=self.colors['primary'], fg='white', relief='flat',
+                                          height=3, bg=C.primary, fg='white', relief='flat',
                                           cursor='hand2', font=('Segoe UI', 10, 'bold'))
         self.dash_btn_upload.pack(side='left', fill='both', expand=True, padx=(0,10))
 
         self.dash_btn_transactions = tk.Button(actions_container, text="📥 Get Transactions\nDownload KML files",
                                                 command=lambda: self.root.nametowidget('.!notebook').select(3),
-                                                height=3, bg=self.colors['accent'], fg='white', relief='flat',
+                                                height=3, bg=C.accent, fg='white', relief='flat',
                                                 cursor='hand2', font=('Segoe UI', 10, 'bold'))
         self.dash_btn_transactions.pack(side='left', fill='both', expand=True)
 
@@ -384,191 +880,162 @@ class FrostbandApp:
         f = self.tab_settings
         
         # Description box
-        desc_frame = tk.Frame(f, bg=self.colors['card'])
+        desc_frame = tk.Frame(f, bg=C.card)
         desc_frame.pack(fill='x', padx=15, pady=(10,5))
         tk.Label(desc_frame, text="⚙️ Configure WiGLE API credentials and Pi connection", 
-                bg=self.colors['card'], fg=self.colors['text'], font=('Segoe UI', 10, 'bold'),
+                bg=C.card, fg=C.text, font=('Segoe UI', 10, 'bold'),
                 anchor='w').pack(fill='x')
         
         # Spacer for consistency
-        tk.Label(f, text="", bg=self.colors['card']).pack(anchor='w', padx=10, pady=5)
+        tk.Label(f, text="", bg=C.card).pack(anchor='w', padx=10, pady=5)
         
         # WiGLE API section with header
-        wigle_frame = tk.Frame(f, bg=self.colors['card'])
+        wigle_frame = tk.Frame(f, bg=C.card)
         wigle_frame.pack(fill='x', padx=15, pady=(5,0))
         
-        header_frame = tk.Frame(wigle_frame, bg=self.colors['card'])
+        header_frame = tk.Frame(wigle_frame, bg=C.card)
         header_frame.pack(fill='x', pady=(0,5))
         tk.Label(header_frame, text="WiGLE API Credentials", font=('Segoe UI', 9, 'bold'),
-                bg=self.colors['card'], fg=self.colors['text']).pack(side='left')
+                bg=C.card, fg=C.text).pack(side='left')
         tk.Button(header_frame, text="Get API Key →", command=lambda: webbrowser.open('https://wigle.net/account'), 
-                 fg=self.colors['primary'], bg=self.colors['card'], relief='flat', cursor='hand2',
+                 fg=C.primary, bg=C.card, relief='flat', cursor='hand2',
                  font=('Segoe UI', 9, 'underline')).pack(side='left', padx=10)
         
         # API ID
-        id_frame = tk.Frame(wigle_frame, bg=self.colors['card'])
+        id_frame = tk.Frame(wigle_frame, bg=C.card)
         id_frame.pack(fill='x', pady=2)
-        tk.Label(id_frame, text="WiGLE API ID:", bg=self.colors['card'], fg=self.colors['text'], width=20, anchor='e').pack(side='left', padx=5)
-        self.txt_api_id = tk.Entry(id_frame, width=40, bg='#3A3A3A', fg=self.colors['text'],
-                    insertbackground=self.colors['primary'], relief='solid', borderwidth=2,
-                    highlightthickness=1, highlightbackground=self.colors['primary'], highlightcolor=self.colors['primary'])
+        tk.Label(id_frame, text="WiGLE API ID:", bg=C.card, fg=C.text, width=20, anchor='e').pack(side='left', padx=5)
+        self.txt_api_id = self._entry(id_frame, 40)
         self.txt_api_id.pack(side='left', padx=5)
         self.txt_api_id.insert(0, self.config['wigle_api_id'])
         
         # API Token
-        token_frame = tk.Frame(wigle_frame, bg=self.colors['card'])
+        token_frame = tk.Frame(wigle_frame, bg=C.card)
         token_frame.pack(fill='x', pady=2)
-        tk.Label(token_frame, text="WiGLE API Token:", bg=self.colors['card'], fg=self.colors['text'], width=20, anchor='e').pack(side='left', padx=5)
-        self.txt_api_token = tk.Entry(token_frame, width=40, show='*', bg='#3A3A3A', fg=self.colors['text'],
-                    insertbackground=self.colors['primary'], relief='solid', borderwidth=2,
-                    highlightthickness=1, highlightbackground=self.colors['primary'], highlightcolor=self.colors['primary'])
+        tk.Label(token_frame, text="WiGLE API Token:", bg=C.card, fg=C.text, width=20, anchor='e').pack(side='left', padx=5)
+        self.txt_api_token = self._entry(token_frame, 40, show='*')
         self.txt_api_token.pack(side='left', padx=5)
         
         # Note about token clearing
-        note_frame = tk.Frame(wigle_frame, bg=self.colors['card'])
+        note_frame = tk.Frame(wigle_frame, bg=C.card)
         note_frame.pack(fill='x', pady=(0,10))
         tk.Label(note_frame, text="Note: API token will disappear after hitting save. Don't worry, it has been saved.", 
-                fg=self.colors['text_secondary'], font=('Segoe UI', 8, 'italic'),
-                bg=self.colors['card']).pack(anchor='w', padx=(130,0))
+                fg=C.text_secondary, font=('Segoe UI', 8, 'italic'),
+                bg=C.card).pack(anchor='w', padx=(130,0))
         
         # Remote settings
         rf = ttk.LabelFrame(f, text="Remote (Raspberry Pi) + Paths", padding=10)
         rf.pack(fill='x', padx=15, pady=10)
         
+        # One grid on the LabelFrame instead of a Frame per row: label | entry | (Pi User label | entry) or Browse
+        def label(text, row, col, width=18, padx=5):
+            tk.Label(rf, text=text, bg=C.card, fg=C.text, width=width, anchor='e').grid(row=row, column=col, padx=padx, pady=2)
+        def browse(attr, row):
+            tk.Button(rf, text="Browse...", command=lambda: self._browse_folder(attr), width=10,
+                     bg=C.primary, fg='white', relief='flat', cursor='hand2').grid(row=row, column=4, padx=5, pady=2)
+        
         # Pi Host and User on same row
-        row1 = tk.Frame(rf, bg=self.colors['card'])
-        row1.pack(fill='x', pady=2)
-        tk.Label(row1, text="Pi Host (IP):", bg=self.colors['card'], fg=self.colors['text'], width=18, anchor='e').pack(side='left', padx=5)
-        self.txt_pi_host = tk.Entry(row1, width=25, bg='#3A3A3A', fg=self.colors['text'],
-                    insertbackground=self.colors['primary'], relief='solid', borderwidth=2,
-                    highlightthickness=1, highlightbackground=self.colors['primary'], highlightcolor=self.colors['primary'])
-        self.txt_pi_host.pack(side='left', padx=5)
+        label("Pi Host (IP):", 0, 0)
+        self.txt_pi_host = self._entry(rf, 25)
+        self.txt_pi_host.grid(row=0, column=1, padx=5, pady=2, sticky='w')
         self.txt_pi_host.insert(0, self.config['pi_host'])
-        
-        tk.Label(row1, text="Pi User:", bg=self.colors['card'], fg=self.colors['text'], width=10, anchor='e').pack(side='left', padx=(20,5))
-        self.txt_pi_user = tk.Entry(row1, width=20, bg='#3A3A3A', fg=self.colors['text'],
-                    insertbackground=self.colors['primary'], relief='solid', borderwidth=2,
-                    highlightthickness=1, highlightbackground=self.colors['primary'], highlightcolor=self.colors['primary'])
-        self.txt_pi_user.pack(side='left', padx=5)
+        label("Pi User:", 0, 2, width=10, padx=(20,5))
+        self.txt_pi_user = self._entry(rf, 20)
+        self.txt_pi_user.grid(row=0, column=3, padx=5, pady=2, sticky='w')
         self.txt_pi_user.insert(0, self.config['pi_user'])
         
-        # Pi Dir
-        row2 = tk.Frame(rf, bg=self.colors['card'])
-        row2.pack(fill='x', pady=2)
-        tk.Label(row2, text="Pi Dir:", bg=self.colors['card'], fg=self.colors['text'], width=18, anchor='e').pack(side='left', padx=5)
-        self.txt_pi_dir = tk.Entry(row2, width=60, bg='#3A3A3A', fg=self.colors['text'],
-                    insertbackground=self.colors['primary'], relief='solid', borderwidth=2,
-                    highlightthickness=1, highlightbackground=self.colors['primary'], highlightcolor=self.colors['primary'])
-        self.txt_pi_dir.pack(side='left', padx=5)
-        self.txt_pi_dir.insert(0, self.config['pi_dir'])
-        
-        # Local Kismet Dir
-        row3 = tk.Frame(rf, bg=self.colors['card'])
-        row3.pack(fill='x', pady=2)
-        tk.Label(row3, text="Local Kismet Dir:", bg=self.colors['card'], fg=self.colors['text'], width=18, anchor='e').pack(side='left', padx=5)
-        self.txt_win_dir = tk.Entry(row3, width=60, bg='#3A3A3A', fg=self.colors['text'],
-                    insertbackground=self.colors['primary'], relief='solid', borderwidth=2,
-                    highlightthickness=1, highlightbackground=self.colors['primary'], highlightcolor=self.colors['primary'])
-        self.txt_win_dir.pack(side='left', padx=5)
-        self.txt_win_dir.insert(0, self.config['win_dir'])
-        tk.Button(row3, text="Browse...", command=lambda: self._browse_folder('txt_win_dir'), width=10,
-                 bg=self.colors['primary'], fg='white', relief='flat', cursor='hand2').pack(side='left', padx=5)
-        
-        # WiGLE Output Dir
-        row4 = tk.Frame(rf, bg=self.colors['card'])
-        row4.pack(fill='x', pady=2)
-        tk.Label(row4, text="WiGLE Output Dir:", bg=self.colors['card'], fg=self.colors['text'], width=18, anchor='e').pack(side='left', padx=5)
-        self.txt_wigle_out = tk.Entry(row4, width=60, bg='#3A3A3A', fg=self.colors['text'],
-                    insertbackground=self.colors['primary'], relief='solid', borderwidth=2,
-                    highlightthickness=1, highlightbackground=self.colors['primary'], highlightcolor=self.colors['primary'])
-        self.txt_wigle_out.pack(side='left', padx=5)
-        self.txt_wigle_out.insert(0, self.config['wigle_out_dir'])
-        tk.Button(row4, text="Browse...", command=lambda: self._browse_folder('txt_wigle_out'), width=10,
-                 bg=self.colors['primary'], fg='white', relief='flat', cursor='hand2').pack(side='left', padx=5)
+        # Pi Dir, local Kismet dir and WiGLE output dir
+        for row, (text, attr, key) in enumerate((("Pi Dir:", 'txt_pi_dir', 'pi_dir'),
+                                                 ("Local Kismet Dir:", 'txt_win_dir', 'win_dir'),
+                                                 ("WiGLE Output Dir:", 'txt_wigle_out', 'wigle_out_dir')), 1):
+            label(text, row, 0)
+            entry = self._entry(rf, 60)
+            entry.grid(row=row, column=1, columnspan=3, padx=5, pady=2, sticky='w')
+            entry.insert(0, self.config[key])
+            setattr(self, attr, entry)
+            if key != 'pi_dir': browse(attr, row)
         
         # Note
-        note_frame2 = tk.Frame(rf, bg=self.colors['card'])
-        note_frame2.pack(fill='x', pady=(10,0))
-        tk.Label(note_frame2, text="Note: Click 'Save Settings' below to apply changes", 
-                fg=self.colors['text_secondary'], font=('Segoe UI', 8, 'italic'),
-                bg=self.colors['card']).pack()
+        tk.Label(rf, text="Note: Click 'Save Settings' below to apply changes", 
+                fg=C.text_secondary, font=('Segoe UI', 8, 'italic'),
+                bg=C.card).grid(row=4, column=0, columnspan=5, pady=(10,0))
         
         # SSH Key Setup section
         ssh_frame = ttk.LabelFrame(f, text="SSH Key Setup (One-Time)", padding=10)
         ssh_frame.pack(fill='x', padx=15, pady=10)
         
-        info_row = tk.Frame(ssh_frame, bg=self.colors['card'])
+        info_row = tk.Frame(ssh_frame, bg=C.card)
         info_row.pack(fill='x', pady=5)
         tk.Label(info_row, text="SSH keys allow passwordless connection to your Pi.", 
-                bg=self.colors['card'], fg=self.colors['text_secondary'], font=('Segoe UI', 8)).pack(anchor='w')
+                bg=C.card, fg=C.text_secondary, font=('Segoe UI', 8)).pack(anchor='w')
         
-        btn_row = tk.Frame(ssh_frame, bg=self.colors['card'])
+        btn_row = tk.Frame(ssh_frame, bg=C.card)
         btn_row.pack(fill='x', pady=5)
         
         tk.Button(btn_row, text="1. Generate SSH Key", command=self._generate_ssh_key, width=20,
-                 bg=self.colors['secondary'], fg='white', relief='flat', cursor='hand2').pack(side='left', padx=5)
+                 bg=C.secondary, fg='white', relief='flat', cursor='hand2').pack(side='left', padx=5)
         ToolTip(btn_row.winfo_children()[-1], "Create a new SSH key pair (if you don't have one)")
         
         tk.Button(btn_row, text="2. Copy Key to Pi", command=self._copy_key_to_pi, width=20,
-                 bg=self.colors['primary'], fg='white', relief='flat', cursor='hand2').pack(side='left', padx=5)
+                 bg=C.primary, fg='white', relief='flat', cursor='hand2').pack(side='left', padx=5)
         ToolTip(btn_row.winfo_children()[-1], "Upload your SSH key to the Pi (requires password once)")
         
         tk.Button(btn_row, text="3. Test Connection", command=self._test_ssh_connection, width=20,
-                 bg=self.colors['accent'], fg='white', relief='flat', cursor='hand2').pack(side='left', padx=5)
+                 bg=C.accent, fg='white', relief='flat', cursor='hand2').pack(side='left', padx=5)
         ToolTip(btn_row.winfo_children()[-1], "Verify that SSH key authentication works")
         
         self.ssh_status_label = tk.Label(ssh_frame, text="Status: Not configured", 
-                                         bg=self.colors['card'], fg=self.colors['text_secondary'], 
+                                         bg=C.card, fg=C.text_secondary, 
                                          font=('Segoe UI', 8), anchor='w')
         self.ssh_status_label.pack(fill='x', pady=5)
         
         # Save button
-        save_frame = tk.Frame(f, bg=self.colors['card'])
+        save_frame = tk.Frame(f, bg=C.card)
         save_frame.pack(fill='x', padx=15, pady=10)
         tk.Button(save_frame, text="Save Settings", command=self._save_settings, width=20,
-                 bg=self.colors['secondary'], fg='white', relief='flat', cursor='hand2',
+                 bg=C.secondary, fg='white', relief='flat', cursor='hand2',
                  font=('Segoe UI', 9, 'bold')).pack(anchor='w')
     
     def _build_rpi_tab(self):
         f = self.tab_rpi
         
         # Description box
-        desc_frame = tk.Frame(f, bg=self.colors['card'])
+        desc_frame = tk.Frame(f, bg=C.card)
         desc_frame.pack(fill='x', padx=15, pady=(10,5))
         tk.Label(desc_frame, text="📡 Control and file management for your RPi", 
-                bg=self.colors['card'], fg=self.colors['text'], font=('Segoe UI', 10, 'bold'),
+                bg=C.card, fg=C.text, font=('Segoe UI', 10, 'bold'),
                 anchor='w').pack(fill='x')
         
-        self.lbl_pi_hint = tk.Label(f, text="", fg=self.colors['accent'], bg=self.colors['card'])
+        self.lbl_pi_hint = tk.Label(f, text="", fg=C.accent, bg=C.card)
         self.lbl_pi_hint.pack(anchor='w', padx=10, pady=5)
         
         # File Management section
         file_mgmt_frame = ttk.LabelFrame(f, text="File Management", padding=10)
         file_mgmt_frame.pack(fill='x', padx=10, pady=5)
         
-        bf1 = tk.Frame(file_mgmt_frame, bg=self.colors['card'])
+        bf1 = tk.Frame(file_mgmt_frame, bg=C.card)
         bf1.pack(fill='x', pady=2)
         self.btn_upload_direct = tk.Button(bf1, text="Upload Direct to WiGLE", command=self._upload_direct_to_wigle, width=52,
-                                           bg=self.colors['secondary'], fg='white', relief='flat', cursor='hand2')
+                                           bg=C.secondary, fg='white', relief='flat', cursor='hand2')
         self.btn_upload_direct.pack(side='left', padx=2)
         ToolTip(self.btn_upload_direct, "Upload files directly from Pi to WiGLE without copying to PC, then delete from Pi")
         
-        bf2 = tk.Frame(file_mgmt_frame, bg=self.colors['card'])
+        bf2 = tk.Frame(file_mgmt_frame, bg=C.card)
         bf2.pack(fill='x', pady=2)
         self.btn_automatic = tk.Button(bf2, text="Automatic (Stop → Copy → Verify → Delete)", command=self._automatic, width=52,
-                                       bg=self.colors['secondary'], fg='white', relief='flat', cursor='hand2', font=('Segoe UI', 9, 'bold'))
+                                       bg=C.secondary, fg='white', relief='flat', cursor='hand2', font=('Segoe UI', 9, 'bold'))
         self.btn_automatic.pack(side='left', padx=2)
         ToolTip(self.btn_automatic, "Stop Kismet, copy files, verify integrity, then delete from Pi")
         
-        bf3 = tk.Frame(file_mgmt_frame, bg=self.colors['card'])
+        bf3 = tk.Frame(file_mgmt_frame, bg=C.card)
         bf3.pack(fill='x', pady=2)
         self.btn_copy_wigle = tk.Button(bf3, text="Copy .wiglecsv from RPi", command=self._copy_wigle, width=25,
-                                        bg=self.colors['secondary'], fg='white', relief='flat', cursor='hand2')
+                                        bg=C.secondary, fg='white', relief='flat', cursor='hand2')
         self.btn_copy_wigle.pack(side='left', padx=2)
         ToolTip(self.btn_copy_wigle, "Download all .wiglecsv files from the Raspberry Pi to your local Kismet directory")
         
         self.btn_delete_wigle = tk.Button(bf3, text="Delete .wiglecsv on RPi", command=self._delete_wigle, width=25,
-                                          bg=self.colors['secondary'], fg='white', relief='flat', cursor='hand2')
+                                          bg=C.secondary, fg='white', relief='flat', cursor='hand2')
         self.btn_delete_wigle.pack(side='left', padx=2)
         ToolTip(self.btn_delete_wigle, "Permanently delete all .wiglecsv files from the Raspberry Pi")
         
@@ -576,20 +1043,20 @@ class FrostbandApp:
         kismet_control_frame = ttk.LabelFrame(f, text="Kismet Control", padding=10)
         kismet_control_frame.pack(fill='x', padx=10, pady=5)
         
-        bf4 = tk.Frame(kismet_control_frame, bg=self.colors['card'])
+        bf4 = tk.Frame(kismet_control_frame, bg=C.card)
         bf4.pack(fill='x', pady=2)
         self.btn_start_kismet = tk.Button(bf4, text="Start Kismet", command=self._start_kismet, width=17,
-                                          bg=self.colors['secondary'], fg='white', relief='flat', cursor='hand2')
+                                          bg=C.secondary, fg='white', relief='flat', cursor='hand2')
         self.btn_start_kismet.pack(side='left', padx=2)
         ToolTip(self.btn_start_kismet, "Start the Kismet service on the Raspberry Pi")
         
         self.btn_stop_kismet = tk.Button(bf4, text="Stop Kismet", command=self._stop_kismet, width=17,
-                                         bg=self.colors['danger'], fg='white', relief='flat', cursor='hand2')
+                                         bg=C.danger, fg='white', relief='flat', cursor='hand2')
         self.btn_stop_kismet.pack(side='left', padx=2)
         ToolTip(self.btn_stop_kismet, "Stop the Kismet service on the Raspberry Pi")
         
         self.btn_restart_kismet = tk.Button(bf4, text="Restart Kismet", command=self._restart_kismet, width=17,
-                                           bg=self.colors['accent'], fg='white', relief='flat', cursor='hand2')
+                                           bg=C.accent, fg='white', relief='flat', cursor='hand2')
         self.btn_restart_kismet.pack(side='left', padx=2)
         ToolTip(self.btn_restart_kismet, "Restart the Kismet service on the Raspberry Pi")
         
@@ -597,77 +1064,55 @@ class FrostbandApp:
         rpi_control_frame = ttk.LabelFrame(f, text="RPi Control", padding=10)
         rpi_control_frame.pack(fill='x', padx=10, pady=5)
         
-        bf5 = tk.Frame(rpi_control_frame, bg=self.colors['card'])
+        bf5 = tk.Frame(rpi_control_frame, bg=C.card)
         bf5.pack(fill='x', pady=2)
         self.btn_reboot = tk.Button(bf5, text="Reboot RPi", command=self._reboot_pi, width=25,
-                                    bg=self.colors['accent'], fg='white', relief='flat', cursor='hand2')
+                                    bg=C.accent, fg='white', relief='flat', cursor='hand2')
         self.btn_reboot.pack(side='left', padx=2)
         ToolTip(self.btn_reboot, "Reboot the Raspberry Pi")
         
         self.btn_shutdown = tk.Button(bf5, text="Shutdown RPi", command=self._shutdown_pi, width=25,
-                                      bg=self.colors['danger'], fg='white', relief='flat', cursor='hand2')
+                                      bg=C.danger, fg='white', relief='flat', cursor='hand2')
         self.btn_shutdown.pack(side='left', padx=2)
         ToolTip(self.btn_shutdown, "Safely shutdown the Raspberry Pi")
         
         self.lbl_pi_info = tk.Label(f, text="Source: (not configured)", anchor='w', 
-                                    bg=self.colors['card'], fg=self.colors['text_secondary'])
+                                    bg=C.card, fg=C.text_secondary)
         self.lbl_pi_info.pack(fill='x', padx=10, pady=5)
         self.txt_pull_log = scrolledtext.ScrolledText(f, height=22, width=110,
-                                                       bg=self.colors['bg_secondary'], fg=self.colors['text'],
-                                                       insertbackground=self.colors['text'], relief='flat', borderwidth=2)
+                                                       bg=C.bg_secondary, fg=C.text,
+                                                       insertbackground=C.text, relief='flat', borderwidth=2)
         self.txt_pull_log.pack(fill='both', expand=True, padx=10, pady=5)
     
     def _build_upload_tab(self):
         f = self.tab_upload
         
         # Description box
-        desc_frame = tk.Frame(f, bg=self.colors['card'])
+        desc_frame = tk.Frame(f, bg=C.card)
         desc_frame.pack(fill='x', padx=15, pady=(10,5))
         tk.Label(desc_frame, text="📤 Manage your locally stored wiglecsv files", 
-                bg=self.colors['card'], fg=self.colors['text'], font=('Segoe UI', 10, 'bold'),
+                bg=C.card, fg=C.text, font=('Segoe UI', 10, 'bold'),
                 anchor='w').pack(fill='x')
         
         # Spacer for consistency
-        tk.Label(f, text="", bg=self.colors['card']).pack(anchor='w', padx=10, pady=5)
+        tk.Label(f, text="", bg=C.card).pack(anchor='w', padx=10, pady=5)
         
-        bf = tk.Frame(f, bg=self.colors['card'])
+        bf = tk.Frame(f, bg=C.card)
         bf.pack(fill='x', padx=10, pady=5)
-        button_configs = [
-            ("Refresh list", self._refresh_upload_list, 15, self.colors['primary']),
-            ("Select All", lambda: self._set_all_checks(self.upload_checks, self.tree_upload, True), 12, self.colors['primary']),
-            ("Select None", lambda: self._set_all_checks(self.upload_checks, self.tree_upload, False), 12, self.colors['primary']),
-            ("Upload", self._upload_files, 12, self.colors['secondary']),
-            ("Delete", self._delete_local, 12, self.colors['danger']),
-            ("Archive", self._archive_local, 12, self.colors['accent'])
-        ]
-        for txt, cmd, w, color in button_configs:
-            fg = 'white'
-            tk.Button(bf, text=txt, command=cmd, width=w, bg=color, fg=fg, 
+        for txt, name, args, w, color in UPLOAD_BUTTONS:
+            tk.Button(bf, text=txt, command=self._button_command(name, args), width=w, bg=color, fg='white',
                      relief='flat', cursor='hand2').pack(side='left', padx=2)
         
-        tf = tk.Frame(f, bg=self.colors['card'])
+        tf = tk.Frame(f, bg=C.card)
         tf.pack(fill='both', expand=True, padx=10, pady=5)
         sb = ttk.Scrollbar(tf)
         sb.pack(side='right', fill='y')
-        self.tree_upload = ttk.Treeview(tf, columns=('File', 'Size', 'Status', 'TransID'), show='tree headings', yscrollcommand=sb.set)
-        sb.config(command=self.tree_upload.yview)
-        self.tree_upload.heading('#0', text='☐')
+        self.tree_upload = LazyTree(tf, sb, ('File', 'Size', 'Status', 'TransID'), show='tree headings')
+        self._check_tags(self.tree_upload)
         for col, w in [('File', 500), ('Size', 100), ('Status', 100), ('TransID', 120)]:
             self.tree_upload.heading(col, text=col)
             self.tree_upload.column(col, width=w)
         self.tree_upload.column('#0', width=30, stretch=False)
-        # Dark theme for treeview
-        style = ttk.Style()
-        style.configure("Treeview", 
-                       background=self.colors['bg_secondary'],
-                       foreground=self.colors['text'],
-                       fieldbackground=self.colors['bg_secondary'],
-                       borderwidth=0)
-        style.configure("Treeview.Heading",
-                       background=self.colors['primary'],
-                       foreground='white',
-                       borderwidth=0)
-        style.map('Treeview', background=[('selected', self.colors['primary'])])
         self.tree_upload.pack(fill='both', expand=True)
         self.tree_upload.bind('<Button-1>', lambda e: self._toggle_check(e, self.tree_upload, self.upload_checks))
     
@@ -675,41 +1120,36 @@ class FrostbandApp:
         f = self.tab_tx
         
         # Description box
-        desc_frame = tk.Frame(f, bg=self.colors['card'])
+        desc_frame = tk.Frame(f, bg=C.card)
         desc_frame.pack(fill='x', padx=15, pady=(10,5))
         tk.Label(desc_frame, text="📥 Find and download your WiGLE transaction files (.KML)", 
-                bg=self.colors['card'], fg=self.colors['text'], font=('Segoe UI', 10, 'bold'),
+                bg=C.card, fg=C.text, font=('Segoe UI', 10, 'bold'),
                 anchor='w').pack(fill='x')
         
         # Spacer for consistency
-        tk.Label(f, text="", bg=self.colors['card']).pack(anchor='w', padx=10, pady=5)
+        tk.Label(f, text="", bg=C.card).pack(anchor='w', padx=10, pady=5)
         
-        df = tk.Frame(f, bg=self.colors['card'])
+        df = tk.Frame(f, bg=C.card)
         df.pack(fill='x', padx=10, pady=5)
-        tk.Label(df, text="Start Date (YYYYMMDD):", bg=self.colors['card'], fg=self.colors['text']).pack(side='left', padx=5)
-        self.txt_start = tk.Entry(df, width=15, bg='#3A3A3A', fg=self.colors['text'],
-                                 insertbackground=self.colors['primary'], relief='solid', borderwidth=2,
-                                 highlightthickness=1, highlightbackground=self.colors['primary'], highlightcolor=self.colors['primary'])
+        tk.Label(df, text="Start Date (YYYYMMDD):", bg=C.card, fg=C.text).pack(side='left', padx=5)
+        self.txt_start = self._entry(df, 15)
         self.txt_start.pack(side='left', padx=5)
-        tk.Label(df, text="End Date (YYYYMMDD):", bg=self.colors['card'], fg=self.colors['text']).pack(side='left', padx=5)
-        self.txt_end = tk.Entry(df, width=15, bg='#3A3A3A', fg=self.colors['text'],
-                               insertbackground=self.colors['primary'], relief='solid', borderwidth=2,
-                               highlightthickness=1, highlightbackground=self.colors['primary'], highlightcolor=self.colors['primary'])
+        tk.Label(df, text="End Date (YYYYMMDD):", bg=C.card, fg=C.text).pack(side='left', padx=5)
+        self.txt_end = self._entry(df, 15)
         self.txt_end.pack(side='left', padx=5)
         tk.Button(df, text="Find Transactions", command=self._find_transactions, width=20,
-                 bg=self.colors['primary'], fg='white', relief='flat', cursor='hand2').pack(side='left', padx=5)
+                 bg=C.primary, fg='white', relief='flat', cursor='hand2').pack(side='left', padx=5)
         
         self.lbl_task_status = tk.Label(f, text="Task Status: (select a transaction)", anchor='w',
-                                        bg=self.colors['card'], fg=self.colors['text_secondary'])
+                                        bg=C.card, fg=C.text_secondary)
         self.lbl_task_status.pack(fill='x', padx=10, pady=5)
         
-        tf = tk.Frame(f, bg=self.colors['card'])
+        tf = tk.Frame(f, bg=C.card)
         tf.pack(fill='both', expand=True, padx=10, pady=5)
         sb = ttk.Scrollbar(tf)
         sb.pack(side='right', fill='y')
-        self.tree_tx = ttk.Treeview(tf, columns=('TransID', 'Date', 'Status', 'Device', 'File'), show='tree headings', yscrollcommand=sb.set)
-        sb.config(command=self.tree_tx.yview)
-        self.tree_tx.heading('#0', text='☐')
+        self.tree_tx = LazyTree(tf, sb, ('TransID', 'Date', 'Status', 'Device', 'File'), show='tree headings')
+        self._check_tags(self.tree_tx)
         for col, w in [('TransID', 200), ('Date', 90), ('Status', 90), ('Device', 180), ('File', 250)]:
             self.tree_tx.heading(col, text='Transaction ID' if col=='TransID' else 'File (API)' if col=='File' else col)
             self.tree_tx.column(col, width=w)
@@ -718,46 +1158,82 @@ class FrostbandApp:
         self.tree_tx.bind('<Button-1>', lambda e: self._toggle_check(e, self.tree_tx, self.tx_checks))
         self.tree_tx.bind('<<TreeviewSelect>>', lambda e: self.lbl_task_status.config(text=f"Selected: {self.tree_tx.item(self.tree_tx.selection()[0])['values'][0]}") if self.tree_tx.selection() else None)
         
-        bf = tk.Frame(f, bg=self.colors['card'])
+        bf = tk.Frame(f, bg=C.card)
         bf.pack(fill='x', padx=10, pady=5)
-        button_configs = [
-            ("Select All", lambda: self._set_all_checks(self.tx_checks, self.tree_tx, True), 15, self.colors['bg_secondary']),
-            ("Select None", lambda: self._set_all_checks(self.tx_checks, self.tree_tx, False), 15, self.colors['bg_secondary']),
-            ("Download All New", self._tx_download_new, 18, self.colors['accent']),
-            ("Download Selected", self._tx_download_selected, 18, self.colors['secondary'])
-        ]
-        for txt, cmd, w, color in button_configs:
-            fg = 'white' if color != self.colors['bg_secondary'] else self.colors['text']
-            tk.Button(bf, text=txt, command=cmd, width=w, bg=color, fg=fg,
+        for txt, name, args, w, color in TX_BUTTONS:
+            fg = 'white' if color != C.bg_secondary else C.text
+            tk.Button(bf, text=txt, command=self._button_command(name, args), width=w, bg=color, fg=fg,
                      relief='flat', cursor='hand2').pack(side='left', padx=2)
     
     def _set_status(self, t):
-        self.status_label.config(text=t)
-        self.root.update_idletasks()
+        # Callable from workers: keep only the latest text and apply it in one Tk callback
+        self._status_text = t
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self._ui(self._flush_status)
+
+    def _flush_status(self):
+        self._status_scheduled = False
+        self.status_label.config(text=self._status_text)
     
     def _log(self, t):
-        self.txt_pull_log.insert('end', t + '\n')
+        # Callable from workers: lines are buffered and written to the log in one batch per Tk callback
+        self._log_buffer.append(t)
+        if not self._log_scheduled:
+            self._log_scheduled = True
+            self._ui(self._flush_log)
+
+    def _flush_log(self):
+        self._log_scheduled = False  # cleared first so a line appended during the drain schedules another flush
+        lines = []
+        while self._log_buffer: lines.append(self._log_buffer.popleft())
+        if not lines: return
+        self._ensure_tab(self.tab_rpi)
+        self.txt_pull_log.insert('end', '\n'.join(lines) + '\n')
+        if (excess := int(self.txt_pull_log.index('end-1c').split('.')[0]) - 1 - LOG_MAX_LINES) > 0:
+            self.txt_pull_log.delete('1.0', f'{excess + 1}.0')
         self.txt_pull_log.see('end')
-        self.root.update_idletasks()
     
     def _reset_progress(self):
-        self.progress['value'] = 0
-        self.progress['maximum'] = 100
+        self._ui(self.progress.config, {'value': 0, 'maximum': 100})
+
+    def _progress_stepper(self, start=0):
+        """step() callable from any worker thread: counts one finished item and moves the progress bar to it"""
+        done, lock = [start], threading.Lock()
+        def step():
+            with lock:
+                done[0] += 1
+                value = done[0]
+            self._ui(self.progress.config, {'value': value})
+        return step
     
+    def _check_tags(self, tree):
+        """Checkbox column: rows carry a 'checked'/'unchecked' tag whose image is the box glyph"""
+        tree.tag_configure('checked', image=self._img_checked)
+        tree.tag_configure('unchecked', image=self._img_unchecked)
+
     def _toggle_check(self, e, tree, checks):
         if tree.identify_region(e.x, e.y) == 'tree' and (item := tree.identify_row(e.y)):
             checks[item] = not checks.get(item, False)
-            tree.item(item, text='☑' if checks[item] else '☐')
+            tree.item(item, tags=('checked',) if checks[item] else ('unchecked',))
     
     def _set_all_checks(self, checks, tree, val):
-        for item in checks:
-            checks[item] = val
-            tree.item(item, text='☑' if val else '☐')
+        flip = [item for item, cur in checks.items() if cur != val]  # only rows that actually change
+        checks.update(dict.fromkeys(flip, val))
+        tree.retag(flip, *(('checked', 'unchecked') if val else ('unchecked', 'checked')))
+
+    def _check_all_uploads(self, val): self._set_all_checks(self.upload_checks, self.tree_upload, val)
+
+    def _check_all_tx(self, val): self._set_all_checks(self.tx_checks, self.tree_tx, val)
+
+    def _button_command(self, name, args):
+        method = getattr(self, name)
+        return (lambda: method(*args)) if args else method
 
     def _refresh_dashboard(self):
         """Update dashboard with current stats"""
         pi_configured = self.config['pi_host'] and self.config['pi_user'] and self.config['pi_dir']
-        wigle_configured = self.config['wigle_api_id'] and self.config['wigle_api_token_enc']
+        wigle_configured = self.config['wigle_api_id'] and self.config['secrets_enc']
 
         # Update quick action button states
         if pi_configured:
@@ -766,37 +1242,32 @@ class FrostbandApp:
             self.dash_btn_automatic.config(state='disabled')
 
         # Update local files count
-        local_files = list(Path(self.config['win_dir']).rglob('*.wiglecsv'))
-        local_count = len(local_files)
-        local_size = sum(f.stat().st_size for f in local_files)
-        self.dash_local_count.config(text=str(local_count))
-        self.dash_local_size.config(text=self._fmt_bytes(local_size))
+        local_count, local_size = self._scan_dir_cached(self.config['win_dir'], '.wiglecsv')
+        self.dash['local_count'].set(str(local_count))
+        self.dash['local_size'].set(self._fmt_bytes(local_size))
 
         # Update Pi files count (only if configured)
         if pi_configured:
-            threading.Thread(target=self._update_pi_files_count, daemon=True).start()
+            self._submit(self._update_pi_files_count)
         else:
-            self.dash_pi_count.config(text="—")
-            self.dash_pi_size.config(text="Not configured")
+            self.dash['pi_count'].set("—")
+            self.dash['pi_size'].set("Not configured")
 
         # Update archives count
-        archives = list(Path(self.config['win_dir']).glob('*.zip'))
-        archive_count = len(archives)
-        archive_size = sum(f.stat().st_size for f in archives)
-        self.dash_archive_count.config(text=str(archive_count))
-        self.dash_archive_size.config(text=self._fmt_bytes(archive_size))
+        archive_count, archive_size = self._scan_dir_cached(self.config['win_dir'], '.zip', recursive=False)
+        self.dash['archive_count'].set(str(archive_count))
+        self.dash['archive_size'].set(self._fmt_bytes(archive_size))
 
         # Update WiGLE stats (only if configured)
         if wigle_configured:
-            threading.Thread(target=self._update_wigle_stats, daemon=True).start()
-            threading.Thread(target=self._update_recent_activity, daemon=True).start()
+            self._refresh_wigle()
         else:
-            self.dash_wifi_discovered.config(text="—")
-            self.dash_wifi_detail.config(text="Configure API in Settings")
-            self.dash_monthly_rank.config(text="—")
-            self.dash_monthly_detail.config(text="—")
-            self.dash_overall_rank.config(text="—")
-            self.dash_overall_detail.config(text="—")
+            self.dash['wifi_discovered'].set("—")
+            self.dash['wifi_detail'].set("Configure API in Settings")
+            self.dash['monthly_rank'].set("—")
+            self.dash['monthly_detail'].set("—")
+            self.dash['overall_rank'].set("—")
+            self.dash['overall_detail'].set("—")
             self.dash_recent_text.config(state='normal')
             self.dash_recent_text.delete('1.0', 'end')
             self.dash_recent_text.insert('1.0', "Configure WiGLE API in Settings to view recent upload activity")
@@ -806,104 +1277,107 @@ class FrostbandApp:
 
     def _schedule_auto_refresh(self):
         """Schedule automatic dashboard refreshes"""
-        # Refresh WiGLE stats and recent activity every 30 seconds
-        self._auto_refresh_wigle_and_activity()
-
-        # Check for file changes every 5 seconds
+        self._start_watcher()
+        self._tick_n = 0
+        self._tick()
+
+    def _tick(self):
+        """Single auto-refresh timer: file changes every tick, WiGLE stats every WIGLE_REFRESH_TICKS"""
+        if self._tick_n % WIGLE_REFRESH_TICKS == 0:
+            self._auto_refresh_wigle_and_activity()
         self._auto_refresh_quick_stats()
+        self._tick_n += 1
+        self.root.after(TICK_MS, self._tick)
 
     def _auto_refresh_wigle_and_activity(self):
-        """Auto-refresh WiGLE statistics and recent activity every 30 seconds"""
-        wigle_configured = self.config['wigle_api_id'] and self.config['wigle_api_token_enc']
+        """Auto-refresh WiGLE statistics and recent activity"""
+        wigle_configured = self.config['wigle_api_id'] and self.config['secrets_enc']
 
         if wigle_configured:
-            threading.Thread(target=self._update_wigle_stats, daemon=True).start()
-            threading.Thread(target=self._update_recent_activity, daemon=True).start()
-
-        # Schedule next refresh in 30 seconds
-        self.root.after(30000, self._auto_refresh_wigle_and_activity)
+            self._refresh_wigle()
 
     def _auto_refresh_quick_stats(self):
         """Auto-refresh quick stats only when file counts change"""
+        try:
+            # Local files are only polled when no file watcher is running
+            if not self._observer:
+                self._refresh_local_stats()
+
+            # Check Pi files if configured (in background to avoid blocking)
+            pi_configured = self.config['pi_host'] and self.config['pi_user'] and self.config['pi_dir']
+            if pi_configured:
+                self._submit(self._check_pi_files_changed)
+
+        except Exception:
+            pass  # Silently ignore errors in auto-refresh
+
+    def _refresh_local_stats(self):
+        """Update the local file and archive cards if their counts changed"""
         try:
             # Check local files
-            local_files = list(Path(self.config['win_dir']).rglob('*.wiglecsv'))
-            local_count = len(local_files)
+            local_count, local_size = self._scan_dir_cached(self.config['win_dir'], '.wiglecsv')
 
             # Check archives
-            archives = list(Path(self.config['win_dir']).glob('*.zip'))
-            archive_count = len(archives)
+            archive_count, archive_size = self._scan_dir_cached(self.config['win_dir'], '.zip', recursive=False)
 
             # Only update if counts changed
             if local_count != self.last_local_count:
                 self.last_local_count = local_count
-                local_size = sum(f.stat().st_size for f in local_files)
-                self.dash_local_count.config(text=str(local_count))
-                self.dash_local_size.config(text=self._fmt_bytes(local_size))
+                self.dash['local_count'].set(str(local_count))
+                self.dash['local_size'].set(self._fmt_bytes(local_size))
 
             if archive_count != self.last_archive_count:
                 self.last_archive_count = archive_count
-                archive_size = sum(f.stat().st_size for f in archives)
-                self.dash_archive_count.config(text=str(archive_count))
-                self.dash_archive_size.config(text=self._fmt_bytes(archive_size))
-
-            # Check Pi files if configured (in background to avoid blocking)
-            pi_configured = self.config['pi_host'] and self.config['pi_user'] and self.config['pi_dir']
-            if pi_configured:
-                threading.Thread(target=self._check_pi_files_changed, daemon=True).start()
-
+                self.dash['archive_count'].set(str(archive_count))
+                self.dash['archive_size'].set(self._fmt_bytes(archive_size))
         except Exception:
             pass  # Silently ignore errors in auto-refresh
 
-        # Schedule next check in 5 seconds
-        self.root.after(5000, self._auto_refresh_quick_stats)
+    def _pi_file_stats(self):
+        """(count, total_bytes) of the Pi's wiglecsv files from a single SSH round trip"""
+        result = self._ssh("find . -type f -name '*.wiglecsv' -printf '%s\\n' | awk '{n++; s+=$1} END{print n+0, s+0}'", cd=True)
+        if result.returncode != 0 or not result.stdout.strip(): return 0, 0
+        file_count, total_bytes = map(int, result.stdout.split()[:2])
+        self.last_pi_count = file_count
+        return file_count, total_bytes
+
+    def _show_pi_file_stats(self, file_count, total_bytes):
+        self._ui(self._apply_labels, {'pi_count': str(file_count), 'pi_size': self._fmt_bytes(total_bytes)})
 
     def _check_pi_files_changed(self):
         """Check if Pi file count changed and update if needed"""
         try:
-            result = self._ssh(f"cd '{self.config['pi_dir']}'; find . -type f -name '*.wiglecsv' | wc -l")
-            if result.returncode == 0:
-                file_count = int(result.stdout.strip())
-                if file_count != self.last_pi_count:
-                    self.last_pi_count = file_count
-                    # Trigger full Pi update if count changed
-                    self._update_pi_files_count()
+            previous = self.last_pi_count
+            file_count, total_bytes = self._pi_file_stats()
+            if file_count != previous:
+                self._show_pi_file_stats(file_count, total_bytes)
         except:
             pass  # Silently ignore errors
 
     def _update_pi_files_count(self):
         """Background thread to count Pi files"""
         try:
-            result = self._ssh(f"cd '{self.config['pi_dir']}'; find . -type f -name '*.wiglecsv' -exec du -cb {{}} + | tail -1")
-            if result.returncode == 0 and result.stdout.strip():
-                total_bytes = int(result.stdout.strip().split()[0])
-                result2 = self._ssh(f"cd '{self.config['pi_dir']}'; find . -type f -name '*.wiglecsv' | wc -l")
-                file_count = int(result2.stdout.strip()) if result2.returncode == 0 else 0
-                self.root.after(0, lambda: self.dash_pi_count.config(text=str(file_count)))
-                self.root.after(0, lambda: self.dash_pi_size.config(text=self._fmt_bytes(total_bytes)))
-            else:
-                self.root.after(0, lambda: self.dash_pi_count.config(text="0"))
-                self.root.after(0, lambda: self.dash_pi_size.config(text="0 B"))
+            self._show_pi_file_stats(*self._pi_file_stats())
         except:
-            self.root.after(0, lambda: self.dash_pi_count.config(text="?"))
-            self.root.after(0, lambda: self.dash_pi_size.config(text="Connection failed"))
+            self._ui(self._apply_labels, {'pi_count': "?", 'pi_size': "Connection failed"})
 
-    def _update_wigle_stats(self):
-        """Background thread to fetch WiGLE user statistics"""
+    def _fetch_wigle_stats(self):
+        """Worker: fetch WiGLE user statistics as a {dashboard label name: text} payload"""
+        payload = {}
         try:
-            token = self.config_mgr.decrypt_token(self.config['wigle_api_token_enc'])
+            token = self._get_wigle_token()
             if not token:
-                self.root.after(0, lambda: self.dash_wifi_discovered.config(text="Error"))
-                self.root.after(0, lambda: self.dash_wifi_detail.config(text="Token decrypt failed"))
-                return
+                payload['wifi_discovered'] = "Error"
+                payload['wifi_detail'] = "Token decrypt failed"
+                return payload
 
             # Fetch user statistics from WiGLE API
-            r = requests.get("https://api.wigle.net/api/v2/stats/user",
-                           auth=(self.config['wigle_api_id'], token),
-                           headers={'Accept': 'application/json'})
+            r = self.http.get("https://api.wigle.net/api/v2/stats/user",
+                            auth=(self.config['wigle_api_id'], token),
+                            headers={'Accept': 'application/json'}, timeout=HTTP_TIMEOUT)
 
             if r.status_code == 200:
-                data = r.json()
+                data = _json_loads(r.content)
 
                 # Extract statistics
                 if 'statistics' in data:
@@ -912,8 +1386,8 @@ class FrostbandApp:
                     # WiFi discovered
                     discovered = stats.get('discoveredWiFiGPS', 0) + stats.get('discoveredWiFi', 0)
                     total_wifi = stats.get('totalWiFiLocations', 0)
-                    self.root.after(0, lambda d=discovered: self.dash_wifi_discovered.config(text=f"{d:,}"))
-                    self.root.after(0, lambda t=total_wifi: self.dash_wifi_detail.config(text=f"Total locations: {t:,}"))
+                    payload['wifi_discovered'] = f"{discovered:,}"
+                    payload['wifi_detail'] = f"Total locations: {total_wifi:,}"
 
                     # Monthly rank with trend arrow
                     monthly_rank = stats.get('monthRank', 0)
@@ -930,13 +1404,11 @@ class FrostbandApp:
                         else:
                             detail_text = "First month"
 
-                        self.root.after(0, lambda r=monthly_rank, a=trend_arrow:
-                                      self.dash_monthly_rank.config(text=f"#{r:,}{a}"))
-                        self.root.after(0, lambda d=detail_text:
-                                      self.dash_monthly_detail.config(text=d))
+                        payload['monthly_rank'] = f"#{monthly_rank:,}{trend_arrow}"
+                        payload['monthly_detail'] = detail_text
                     else:
-                        self.root.after(0, lambda: self.dash_monthly_rank.config(text="—"))
-                        self.root.after(0, lambda: self.dash_monthly_detail.config(text="No rank yet"))
+                        payload['monthly_rank'] = "—"
+                        payload['monthly_detail'] = "No rank yet"
 
                     # Overall rank with trend arrow
                     rank = stats.get('rank', 0)
@@ -950,54 +1422,65 @@ class FrostbandApp:
                             elif rank > prev_rank:
                                 trend_arrow = " ↓"  # Declined (higher number)
 
-                        self.root.after(0, lambda r=rank, a=trend_arrow:
-                                      self.dash_overall_rank.config(text=f"#{r:,}{a}"))
-                        self.root.after(0, lambda d=discovered, p=prev_rank:
-                                      self.dash_overall_detail.config(text=f"{d:,} discovered" + (f" | Prev: #{p:,}" if p > 0 else "")))
+                        payload['overall_rank'] = f"#{rank:,}{trend_arrow}"
+                        payload['overall_detail'] = f"{discovered:,} discovered" + (f" | Prev: #{prev_rank:,}" if prev_rank > 0 else "")
                     else:
-                        self.root.after(0, lambda: self.dash_overall_rank.config(text="—"))
-                        self.root.after(0, lambda: self.dash_overall_detail.config(text="No rank yet"))
+                        payload['overall_rank'] = "—"
+                        payload['overall_detail'] = "No rank yet"
                 else:
-                    self.root.after(0, lambda: self.dash_wifi_discovered.config(text="N/A"))
-                    self.root.after(0, lambda: self.dash_wifi_detail.config(text="No stats available"))
+                    payload['wifi_discovered'] = "N/A"
+                    payload['wifi_detail'] = "No stats available"
             else:
-                self.root.after(0, lambda: self.dash_wifi_discovered.config(text="Error"))
-                self.root.after(0, lambda: self.dash_wifi_detail.config(text=f"API error: {r.status_code}"))
+                payload['wifi_discovered'] = "Error"
+                payload['wifi_detail'] = f"API error: {r.status_code}"
 
         except Exception as e:
-            self.root.after(0, lambda: self.dash_wifi_discovered.config(text="Error"))
-            self.root.after(0, lambda e=e: self.dash_wifi_detail.config(text=f"Failed: {str(e)[:30]}"))
-
-    def _update_recent_activity(self):
-        """Background thread to fetch recent upload activity from WiGLE"""
+            payload['wifi_discovered'] = "Error"
+            payload['wifi_detail'] = f"Failed: {str(e)[:30]}"
+        return payload
+
+    def _refresh_wigle(self):
+        """Fetch WiGLE stats and recent activity concurrently, then apply both to the dashboard together"""
+        if self._wigle_inflight: return  # previous refresh still running (slow network): don't stack another
+        self._wigle_inflight = True
+        def done(_):
+            # Runs on the Tk thread once per job; only the last one to finish applies both results
+            if not all(f.done() for f in futures) or not self._wigle_inflight: return
+            self._wigle_inflight = False
+            stats, recent = (None if f.exception() else f.result() for f in futures)
+            if stats: self._apply_labels(stats)
+            if recent: self._set_recent_text(recent)
+        futures = [self._submit(fn, on_done=done) for fn in (self._fetch_wigle_stats, self._fetch_recent_activity)]
+
+    def _apply_labels(self, payload):
+        """Tk thread: set several dashboard label variables from one {name: text} update"""
+        for name, text in payload.items():
+            self.dash[name].set(text)
+
+    def _fetch_recent_activity(self):
+        """Worker: fetch recent upload activity from WiGLE as the text for the activity box"""
         try:
-            token = self.config_mgr.decrypt_token(self.config['wigle_api_token_enc'])
+            token = self._get_wigle_token()
             if not token:
-                self.root.after(0, lambda: self._set_recent_text("Token decrypt failed"))
-                return
+                return "Token decrypt failed"
 
             # Fetch recent transactions from WiGLE API
-            r = requests.get("https://api.wigle.net/api/v2/file/transactions?pagestart=0",
-                           auth=(self.config['wigle_api_id'], token),
-                           headers={'Accept': 'application/json'})
+            r = self.http.get("https://api.wigle.net/api/v2/file/transactions?pagestart=0",
+                            auth=(self.config['wigle_api_id'], token),
+                            headers={'Accept': 'application/json'}, timeout=HTTP_TIMEOUT)
 
             if r.status_code == 200:
-                data = r.json()
+                data = _json_loads(r.content)
                 results = data.get('results', [])
 
                 if not results:
-                    self.root.after(0, lambda: self._set_recent_text("No recent uploads found"))
-                    return
+                    return "No recent uploads found"
 
                 # Build recent activity text
-                from datetime import datetime, timedelta
                 now = datetime.now()
                 cutoff_24h = now - timedelta(hours=24)
 
-                activity_lines = []
-                activity_lines.append("╔════════════════════════════════════════════════════════════════════════════════╗")
-                activity_lines.append("║ Recent Uploads (Last 24 Hours)                                                ║")
-                activity_lines.append("╠════════════════════════════════════════════════════════════════════════════════╣")
+                activity_lines = [BOX_TOP, BOX_RECENT_HEADER, BOX_MID]
 
                 recent_count = 0
                 total_new_wifi_24h = 0
@@ -1010,7 +1493,7 @@ class FrostbandApp:
                     # Parse date from transaction ID (YYYYMMDD format at start)
                     try:
                         date_str = trans_id[:8]
-                        tx_date = datetime.strptime(date_str, '%Y%m%d')
+                        tx_date = datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]))  # also rejects non-dates
 
                         # Check if within last 24 hours (rough check, transaction ID is date only)
                         # For more accurate, we'd need the full timestamp, but this is close enough
@@ -1040,21 +1523,21 @@ class FrostbandApp:
                         continue
 
                 if recent_count == 0:
-                    activity_lines.append("║ No uploads in the last 24 hours                                               ║")
+                    activity_lines.append(BOX_NO_UPLOADS)
                 else:
-                    activity_lines.append("╠════════════════════════════════════════════════════════════════════════════════╣")
+                    activity_lines.append(BOX_MID)
                     activity_lines.append(f"║ Total: {recent_count} uploads │ {total_new_wifi_24h} new WiFi networks discovered{' ' * (29 - len(str(total_new_wifi_24h)))}║")
 
-                activity_lines.append("╚════════════════════════════════════════════════════════════════════════════════╝")
+                activity_lines.append(BOX_BOTTOM)
 
                 activity_text = '\n'.join(activity_lines)
-                self.root.after(0, lambda t=activity_text: self._set_recent_text(t))
+                return activity_text
 
             else:
-                self.root.after(0, lambda: self._set_recent_text(f"API error: {r.status_code}"))
+                return f"API error: {r.status_code}"
 
         except Exception as e:
-            self.root.after(0, lambda e=e: self._set_recent_text(f"Error: {str(e)[:50]}"))
+            return f"Error: {str(e)[:50]}"
 
     def _set_recent_text(self, text):
         """Update the recent activity text widget"""
@@ -1070,12 +1553,13 @@ class FrostbandApp:
         return True
     
     def _require_wigle(self):
-        if not (self.config['wigle_api_id'] and self.config['wigle_api_token_enc']):
+        if not (self.config['wigle_api_id'] and self.config['secrets_enc']):
             messagebox.showwarning("Missing Credentials", "Set WiGLE API ID + Token in Settings.")
             return False
         return True
     
     def _update_pi_status(self):
+        if not self._tab_built[self.tab_rpi]: return
         ok = self.config['pi_host'] and self.config['pi_user'] and self.config['pi_dir']
         self.lbl_pi_hint.config(text="" if ok else "Set your Raspberry Pi Host/User/Dir in Settings.")
         self.lbl_pi_info.config(text=f"Source: {self.config['pi_user']}@{self.config['pi_host']}:{self.config['pi_dir']}" if ok else "Source: (not configured)")
@@ -1085,13 +1569,91 @@ class FrostbandApp:
                     self.btn_reboot, self.btn_shutdown]:
             btn.config(state=state)
     
-    def _fmt_bytes(self, b):
-        for u, d in [('B', 1), ('KB', 1024), ('MB', 1024**2), ('GB', 1024**3)]:
-            if b < d * 1024 or u == 'GB':
-                return f"{b/d:.1f} {u}" if d > 1 else f"{b} {u}"
+    def _scan_dir_cached(self, root, suffix, recursive=True):
+        """(count, total_size) of files ending in suffix under root; directories whose mtime is unchanged are not re-listed"""
+        count = size = 0
+        stack = [os.fspath(root)]
+        while stack:
+            d = stack.pop()
+            try: mtime = os.stat(d).st_mtime_ns
+            except OSError: continue
+            cached = self._dir_mtime_cache.get((d, suffix))
+            if cached is None or cached[0] != mtime:
+                n = total = 0
+                subdirs = []
+                try:
+                    with os.scandir(d) as it:
+                        for e in it:
+                            if e.is_dir(follow_symlinks=False): subdirs.append(e.path)
+                            elif e.name.endswith(suffix):
+                                n += 1
+                                total += e.stat().st_size
+                except OSError: pass
+                cached = self._dir_mtime_cache[(d, suffix)] = (mtime, n, total, subdirs)
+            count += cached[1]
+            size += cached[2]
+            if recursive: stack.extend(cached[3])
+        return count, size
+    
+    @staticmethod
+    def _fmt_bytes(b):
+        if b < 1024: return f"{b} B"
+        i = min((int(b).bit_length() - 1) // 10, 3)  # 1024**i <= b, capped at GB
+        return f"{b / (1 << (i * 10)):.1f} {BYTE_UNITS[i]}"
     
-    def _ssh(self, cmd):
-        return subprocess.run(['ssh', f"{self.config['pi_user']}@{self.config['pi_host']}", cmd], capture_output=True, text=True)
+    def _get_wigle_token(self):
+        """Decrypted WiGLE API token, cached in memory until the stored ciphertext changes"""
+        enc = self.config['secrets_enc']
+        if enc != self._token_cache[0]:
+            with self._token_lock:  # the dashboard fetches both ask at once; only one of them decrypts
+                if enc != self._token_cache[0]:
+                    try: token = self.config_mgr.decrypt_secrets(enc).get('wigle_api_token', '')
+                    except KeyUnavailableError: return ''  # not cached: the next call retries once the keyring answers
+                    self._token_cache = (enc, token)
+        return self._token_cache[1]
+
+    def _ssh_argv(self, cmd, cd=False):
+        """ssh argv running cmd on the Pi: a shell script, or an argv list (quoted with shlex.join);
+        cd=True runs it inside pi_dir"""
+        if not isinstance(cmd, str): cmd = shlex.join(cmd)
+        if cd: cmd = f"cd {shlex.quote(self.config['pi_dir'])} && {cmd}"
+        return ['ssh', *SSH_OPTS, f"{self.config['pi_user']}@{self.config['pi_host']}", cmd]
+
+    def _ssh(self, cmd, check=False, cd=False, **kw):
+        return subprocess.run(self._ssh_argv(cmd, cd), capture_output=True, text=True, check=check, **kw, **SUBPROC_KW)
+
+    def _pi_tar_stream(self, manifest=False):
+        """(processes, stream, 'gz' or '') for a tar of pi_dir's wiglecsv files built on the fly (nothing staged on the Pi).
+        When both ends have zstd the Pi compresses with it (several times faster than gzip on its CPU) and a local
+        zstd -dc hands back the plain tar; otherwise the stream is tar.gz. A one-byte tag says which the Pi chose.
+        With manifest, the same ssh session and directory walk also produce the PI_HASH manifest: it is hashed in the
+        background while tar packs the files, then appended as MANIFEST_MEMBER."""
+        def big_pipe(f):
+            if sys.platform == 'linux':
+                try:
+                    import fcntl
+                    fcntl.fcntl(f.fileno(), getattr(fcntl, 'F_SETPIPE_SZ', 1031), 1 << 20)  # 1 MiB pipe instead of 64 KiB
+                except OSError:
+                    pass  # above /proc/sys/fs/pipe-max-size for unprivileged users; keep the default
+        zstd = shutil.which('zstd')
+        # Through the zstd pipe the exit status would be zstd's: tar's own is kept in $S so a failed tar still fails the call
+        pack = ("if command -v zstd >/dev/null 2>&1; then printf Z; S=$(mktemp) || exit; z=0; "
+                "{ tar --null -T - -cf -; echo $? > \"$S\"; } | zstd -q -3 -T0 || z=$?; "
+                "t=$(cat \"$S\"); rm -f \"$S\"; [ \"$z\" = 0 ] || exit \"$z\"; exit \"${t:-1}\"; "
+                "else printf G; tar --null -T - -czf -; fi") if zstd else "printf G; tar --null -T - -czf -"
+        listing = "find . -type f -name '*.wiglecsv' -print0"
+        if manifest:  # tar reads its -T list as it goes, so it packs the files while the hashers read the same (cached) data
+            listing = (f"L=$(mktemp) || exit; trap 'rm -f \"$L\" {MANIFEST_MEMBER}' EXIT; {listing} > \"$L\" && "
+                       f"{{ {{ {PI_HASH}; }} < \"$L\" > {MANIFEST_MEMBER} & cat \"$L\"; wait $! && printf './{MANIFEST_MEMBER}\\0'; }}")
+        proc = subprocess.Popen(self._ssh_argv(f"{listing} | {{ {pack}; }}", cd=True),
+                                stdout=subprocess.PIPE, bufsize=1 << 20, **SUBPROC_KW)
+        big_pipe(proc.stdout)
+        if os.read(proc.stdout.fileno(), 1) != b'Z':  # unbuffered, so the rest is still in the pipe for whoever reads it
+            return [proc], proc.stdout, 'gz'
+        dec = subprocess.Popen([zstd, '-dcq'], stdin=proc.stdout, stdout=subprocess.PIPE, bufsize=1 << 20, **SUBPROC_KW)
+        proc.stdout.close()  # only the decoder reads the ssh pipe now
+        big_pipe(dec.stdout)
+        return [proc, dec], dec.stdout, ''
     
     def _save_settings(self):
         self.config['pi_host'] = self.txt_pi_host.get().strip()
@@ -1100,16 +1662,28 @@ class FrostbandApp:
         self.config['win_dir'] = self.txt_win_dir.get().strip()
         self.config['wigle_out_dir'] = self.txt_wigle_out.get().strip()
         self.config['wigle_api_id'] = self.txt_api_id.get().strip()
+        token_error = None
         if self.txt_api_token.get():
-            self.config['wigle_api_token_enc'] = self.config_mgr.encrypt_token(self.txt_api_token.get())
-            self.txt_api_token.delete(0, 'end')
+            try:
+                secrets = self.config_mgr.decrypt_secrets(self.config['secrets_enc'])
+                secrets['wigle_api_token'] = self.txt_api_token.get()
+                self.config['secrets_enc'] = self.config_mgr.encrypt_secrets(secrets)
+            except KeyUnavailableError as e:
+                token_error = e  # the old secrets_enc stays; the typed token is left in the field to retry
+            else:
+                self.txt_api_token.delete(0, 'end')
+                self._token_cache = (None, '')
         self.config_mgr.save_config(self.config)
-        Path(self.config['win_dir']).mkdir(parents=True, exist_ok=True)
-        Path(self.config['wigle_out_dir']).mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.config['win_dir'], self.config['wigle_out_dir'])
+        self._start_watcher()
         self._update_pi_status()
-        self._refresh_upload_list()
+        self._refresh_upload_list(announce=False, reuse=True)
         self._refresh_dashboard()
-        self._set_status("Settings saved.")
+        if token_error:
+            self._set_status("Settings saved, but the WiGLE token was not (keyring unavailable).")
+            messagebox.showerror("Keyring Unavailable", f"The new WiGLE token could not be encrypted; the old one is kept.\n\n{token_error}")
+        else:
+            self._set_status("Settings saved.")
     
     def _browse_folder(self, attr):
         current = getattr(self, attr).get()
@@ -1118,46 +1692,62 @@ class FrostbandApp:
             getattr(self, attr).delete(0, 'end')
             getattr(self, attr).insert(0, folder)
     
-    def _get_ssh_key_path(self):
-        """Get path to SSH key"""
+    def _get_ssh_key_path(self, kind=None):
+        """Get path to SSH key: the Ed25519 pair, or an RSA pair made before Ed25519 was the default"""
         ssh_dir = Path.home() / '.ssh'
-        return ssh_dir / 'id_rsa', ssh_dir / 'id_rsa.pub'
+        kind = kind or next((k for k in ('ed25519', 'rsa') if (ssh_dir / f'id_{k}.pub').exists()), 'ed25519')
+        return ssh_dir / f'id_{kind}', ssh_dir / f'id_{kind}.pub'
     
     def _generate_ssh_key(self):
-        """Generate SSH key pair"""
-        private_key, public_key = self._get_ssh_key_path()
+        """Generate SSH key pair (ssh-keygen runs on the worker pool, _keygen_done reports the result)"""
+        private_key, public_key = self._get_ssh_key_path('ed25519')
         
         if public_key.exists():
             if not messagebox.askyesno("Key Exists", 
                 "SSH key already exists. Generate a new one? This will overwrite the existing key."):
                 return
         
-        try:
-            self.ssh_status_label.config(text="Status: Generating SSH key...", fg=self.colors['accent'])
-            self.root.update_idletasks()
-            
-            # Generate key with ssh-keygen
+        self.ssh_status_label.config(text="Status: Generating SSH key...", fg=C.accent)
+        self._submit(self._keygen_thread, private_key, public_key, on_done=self._keygen_done)
+
+    def _keygen_thread(self, private_key, public_key):
+        """Worker: run ssh-keygen over the key the user agreed to replace; returns (result, public key path)"""
+        private_key.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        for p in (private_key, public_key): p.unlink(missing_ok=True)  # else ssh-keygen asks "Overwrite (y/n)?" on a stdin we don't have
+        # Ed25519 takes milliseconds where RSA-4096 can take a minute on slow hardware
+        result = subprocess.run(
+            ['ssh-keygen', '-t', 'ed25519', '-f', str(private_key), '-N', '', '-C', 'frostband'],
+            capture_output=True, text=True, **SUBPROC_KW
+        )
+        rsa_key, rsa_pub = self._get_ssh_key_path('rsa')
+        if result.returncode != 0 and 'unknown key type' in result.stderr.lower() and not rsa_pub.exists():  # OpenSSH older than 6.5
+            private_key, public_key = rsa_key, rsa_pub
             result = subprocess.run(
-                ['ssh-keygen', '-t', 'rsa', '-b', '4096', '-f', str(private_key), '-N', ''],
-                capture_output=True, text=True
+                ['ssh-keygen', '-t', 'rsa', '-b', '4096', '-f', str(private_key), '-N', '', '-C', 'frostband'],
+                capture_output=True, text=True, **SUBPROC_KW
             )
-            
+        return result, public_key
+
+    def _keygen_done(self, fut):
+        """Tk thread: report the result of _generate_ssh_key"""
+        try:
+            result, public_key = fut.result()
             if result.returncode == 0:
-                self.ssh_status_label.config(text="Status: ✓ SSH key generated successfully!", fg=self.colors['secondary'])
+                self.ssh_status_label.config(text="Status: ✓ SSH key generated successfully!", fg=C.secondary)
                 messagebox.showinfo("Success", 
                     f"SSH key generated successfully!\n\nPublic key saved to:\n{public_key}")
             else:
-                self.ssh_status_label.config(text="Status: ✗ Failed to generate key", fg=self.colors['danger'])
+                self.ssh_status_label.config(text="Status: ✗ Failed to generate key", fg=C.danger)
                 messagebox.showerror("Error", f"Failed to generate SSH key:\n{result.stderr}")
         
         except FileNotFoundError:
-            self.ssh_status_label.config(text="Status: ✗ ssh-keygen not found", fg=self.colors['danger'])
+            self.ssh_status_label.config(text="Status: ✗ ssh-keygen not found", fg=C.danger)
             messagebox.showerror("Error", 
                 "ssh-keygen not found. Please install OpenSSH:\n\n"
                 "Windows: Settings → Apps → Optional Features → Add OpenSSH Client\n"
                 "Or download from: https://github.com/PowerShell/Win32-OpenSSH/releases")
         except Exception as e:
-            self.ssh_status_label.config(text="Status: ✗ Error occurred", fg=self.colors['danger'])
+            self.ssh_status_label.config(text="Status: ✗ Error occurred", fg=C.danger)
             messagebox.showerror("Error", f"Error generating SSH key:\n{e}")
     
     def _copy_key_to_pi(self):
@@ -1177,16 +1767,15 @@ class FrostbandApp:
         password_dialog = tk.Toplevel(self.root)
         password_dialog.title("Enter Pi Password")
         password_dialog.geometry("400x150")
-        password_dialog.configure(bg=self.colors['card'])
+        password_dialog.configure(bg=C.card)
         password_dialog.transient(self.root)
         password_dialog.grab_set()
         
         tk.Label(password_dialog, text=f"Enter password for {self.config['pi_user']}@{self.config['pi_host']}:", 
-                bg=self.colors['card'], fg=self.colors['text']).pack(pady=10)
+                bg=C.card, fg=C.text).pack(pady=10)
         
         password_var = tk.StringVar()
-        password_entry = tk.Entry(password_dialog, textvariable=password_var, show='*', width=30,
-                                  bg='#3A3A3A', fg=self.colors['text'], insertbackground=self.colors['primary'])
+        password_entry = self._entry(password_dialog, 30, textvariable=password_var, show='*')
         password_entry.pack(pady=10)
         password_entry.focus()
         
@@ -1194,114 +1783,87 @@ class FrostbandApp:
             password = password_var.get()
             password_dialog.destroy()
             if password:
-                threading.Thread(target=self._copy_key_thread, args=(password,), daemon=True).start()
+                self._submit(self._copy_key_thread, password)
         
-        btn_frame = tk.Frame(password_dialog, bg=self.colors['card'])
+        btn_frame = tk.Frame(password_dialog, bg=C.card)
         btn_frame.pack(pady=10)
-        tk.Button(btn_frame, text="Copy Key", command=do_copy, bg=self.colors['secondary'], 
+        tk.Button(btn_frame, text="Copy Key", command=do_copy, bg=C.secondary, 
                  fg='white', relief='flat', width=12).pack(side='left', padx=5)
-        tk.Button(btn_frame, text="Cancel", command=password_dialog.destroy, bg=self.colors['bg_secondary'], 
-                 fg=self.colors['text'], relief='flat', width=12).pack(side='left', padx=5)
+        tk.Button(btn_frame, text="Cancel", command=password_dialog.destroy, bg=C.bg_secondary, 
+                 fg=C.text, relief='flat', width=12).pack(side='left', padx=5)
         
         password_entry.bind('<Return>', lambda e: do_copy())
     
     def _copy_key_thread(self, password):
-        """Background thread to copy SSH key"""
+        """Background thread to copy SSH key: one ssh call appends it from stdin, with the password answered by SSH_ASKPASS"""
         try:
-            self.ssh_status_label.config(text="Status: Copying key to Pi...", fg=self.colors['accent'])
-            self.root.update_idletasks()
+            self._ui(self.ssh_status_label.config, {'text': "Status: Copying key to Pi...", 'fg': C.accent})
             
             private_key, public_key = self._get_ssh_key_path()
             pub_key_content = public_key.read_text().strip()
             
             pi_target = f"{self.config['pi_user']}@{self.config['pi_host']}"
             
-            # Use sshpass to copy the key (works on Windows with OpenSSH)
-            # Alternative approach: use expect-like behavior with subprocess
-            commands = [
-                'mkdir -p ~/.ssh',
-                f'echo "{pub_key_content}" >> ~/.ssh/authorized_keys',
-                'chmod 700 ~/.ssh',
-                'chmod 600 ~/.ssh/authorized_keys'
-            ]
-            
-            # Try using ssh with password via stdin (requires sshpass or alternative)
-            # For Windows, we'll use a different approach with pexpect-like behavior
-            
-            # Create a temporary script to handle the SSH commands
-            script = f"""
-Set-Variable -Name pass -Value '{password}'
-$commands = @(
-    'mkdir -p ~/.ssh',
-    'echo "{pub_key_content}" >> ~/.ssh/authorized_keys',
-    'chmod 700 ~/.ssh',
-    'chmod 600 ~/.ssh/authorized_keys'
-)
-foreach ($cmd in $commands) {{
-    echo $pass | ssh -o StrictHostKeyChecking=no {pi_target} $cmd
-}}
-"""
-            
-            # Actually, let's use a simpler approach with ssh-copy-id if available
-            # Or fall back to manual ssh command
-            try:
-                # Try ssh-copy-id first (Linux/Mac style)
-                result = subprocess.run(
-                    ['ssh-copy-id', '-i', str(public_key), pi_target],
-                    input=password + '\n',
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                success = result.returncode == 0
-            except FileNotFoundError:
-                # ssh-copy-id not available, use manual method
-                # This requires the user to have sshpass or we do it manually
-                cmd = f'type "{public_key}" | ssh {pi_target} "mkdir -p ~/.ssh && cat >> ~/.ssh/authorized_keys && chmod 700 ~/.ssh && chmod 600 ~/.ssh/authorized_keys"'
-                
-                # For Windows, we'll guide the user to do it manually
-                self.root.after(0, lambda: self._show_manual_key_copy_instructions(pub_key_content))
-                return
+            # The key goes over stdin, so nothing in it is ever parsed by a shell; ssh won't read a password from a pipe,
+            # so a throwaway askpass helper hands it over from the environment
+            with tempfile.TemporaryDirectory() as td:
+                env = {**os.environ, 'SSH_ASKPASS': _askpass_helper(td), 'SSH_ASKPASS_REQUIRE': 'force',
+                       'DISPLAY': os.environ.get('DISPLAY', ':0'), 'FROSTBAND_SSH_PASS': password}
+                try:
+                    result = subprocess.run(
+                        ['ssh', '-o', 'StrictHostKeyChecking=accept-new', '-o', 'ConnectTimeout=5', '-o', 'NumberOfPasswordPrompts=1',
+                         pi_target, 'mkdir -p ~/.ssh && cat >> ~/.ssh/authorized_keys && chmod 700 ~/.ssh && chmod 600 ~/.ssh/authorized_keys'],
+                        input=pub_key_content + '\n',
+                        capture_output=True,
+                        text=True,
+                        timeout=30,
+                        env=env,
+                        **SUBPROC_KW
+                    )
+                except FileNotFoundError:
+                    # No OpenSSH client at all: guide the user through doing it by hand
+                    self._ui(self._show_manual_key_copy_instructions, pub_key_content)
+                    return
             
-            if success:
-                self.ssh_status_label.config(text="Status: ✓ SSH key copied successfully!", fg=self.colors['secondary'])
-                self.root.after(0, lambda: messagebox.showinfo("Success", 
-                    "SSH key copied to Pi successfully!\n\nYou can now use passwordless SSH authentication."))
+            if result.returncode == 0:
+                self._ui(self.ssh_status_label.config, {'text': "Status: ✓ SSH key copied successfully!", 'fg': C.secondary})
+                self._ui(messagebox.showinfo, "Success", 
+                    "SSH key copied to Pi successfully!\n\nYou can now use passwordless SSH authentication.")
             else:
-                self.ssh_status_label.config(text="Status: ✗ Failed to copy key", fg=self.colors['danger'])
-                self.root.after(0, lambda: messagebox.showerror("Error", 
-                    f"Failed to copy SSH key:\n{result.stderr}"))
+                self._ui(self.ssh_status_label.config, {'text': "Status: ✗ Failed to copy key", 'fg': C.danger})
+                self._ui(messagebox.showerror, "Error", 
+                    f"Failed to copy SSH key:\n{result.stderr}")
         
         except Exception as e:
-            self.ssh_status_label.config(text="Status: ✗ Error occurred", fg=self.colors['danger'])
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Error copying SSH key:\n{e}"))
+            self._ui(self.ssh_status_label.config, {'text': "Status: ✗ Error occurred", 'fg': C.danger})
+            self._ui(messagebox.showerror, "Error", f"Error copying SSH key:\n{e}")
     
     def _show_manual_key_copy_instructions(self, pub_key_content):
         """Show manual instructions for copying SSH key"""
         instructions = tk.Toplevel(self.root)
         instructions.title("Manual SSH Key Setup")
         instructions.geometry("600x400")
-        instructions.configure(bg=self.colors['card'])
+        instructions.configure(bg=C.card)
         
         tk.Label(instructions, text="Manual SSH Key Setup Required", 
-                bg=self.colors['card'], fg=self.colors['text'], 
+                bg=C.card, fg=C.text, 
                 font=('Segoe UI', 11, 'bold')).pack(pady=10)
         
         tk.Label(instructions, text="Copy the key below and paste it into your Pi:", 
-                bg=self.colors['card'], fg=self.colors['text']).pack(pady=5)
+                bg=C.card, fg=C.text).pack(pady=5)
         
         text_widget = scrolledtext.ScrolledText(instructions, height=10, width=70,
-                                                bg='#3A3A3A', fg=self.colors['text'])
+                                                bg=C.input, fg=C.text)
         text_widget.pack(pady=10, padx=10)
         text_widget.insert('1.0', pub_key_content)
         text_widget.config(state='disabled')
         
         tk.Label(instructions, text="SSH into your Pi and run:", 
-                bg=self.colors['card'], fg=self.colors['text'], 
+                bg=C.card, fg=C.text, 
                 font=('Segoe UI', 9, 'bold')).pack(pady=5)
         
         cmd_widget = scrolledtext.ScrolledText(instructions, height=5, width=70,
-                                               bg='#3A3A3A', fg=self.colors['text'])
+                                               bg=C.input, fg=C.text)
         cmd_widget.pack(pady=5, padx=10)
         cmd_text = """mkdir -p ~/.ssh
 echo "[paste your key here]" >> ~/.ssh/authorized_keys
@@ -1311,7 +1873,7 @@ chmod 600 ~/.ssh/authorized_keys"""
         cmd_widget.config(state='disabled')
         
         tk.Button(instructions, text="Close", command=instructions.destroy,
-                 bg=self.colors['primary'], fg='white', relief='flat', width=15).pack(pady=10)
+                 bg=C.primary, fg='white', relief='flat', width=15).pack(pady=10)
     
     def _test_ssh_connection(self):
         """Test SSH connection"""
@@ -1319,23 +1881,18 @@ chmod 600 ~/.ssh/authorized_keys"""
             messagebox.showwarning("Missing Info", "Please enter Pi Host and Pi User first.")
             return
         
-        self.ssh_status_label.config(text="Status: Testing connection...", fg=self.colors['accent'])
-        self.root.update_idletasks()
-        
+        self.ssh_status_label.config(text="Status: Testing connection...", fg=C.accent)
+        self._submit(lambda: self._ssh(['echo', 'success'], timeout=10), on_done=self._ssh_test_done)
+    
+    def _ssh_test_done(self, fut):
+        """Tk thread: report the result of _test_ssh_connection"""
         try:
-            pi_target = f"{self.config['pi_user']}@{self.config['pi_host']}"
-            result = subprocess.run(
-                ['ssh', '-o', 'BatchMode=yes', '-o', 'ConnectTimeout=5', pi_target, 'echo', 'success'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
+            result = fut.result()
             if result.returncode == 0 and 'success' in result.stdout:
-                self.ssh_status_label.config(text="Status: ✓ SSH connection successful!", fg=self.colors['secondary'])
+                self.ssh_status_label.config(text="Status: ✓ SSH connection successful!", fg=C.secondary)
                 messagebox.showinfo("Success", "SSH connection works!\n\nPasswordless authentication is configured correctly.")
             else:
-                self.ssh_status_label.config(text="Status: ✗ Connection failed", fg=self.colors['danger'])
+                self.ssh_status_label.config(text="Status: ✗ Connection failed", fg=C.danger)
                 messagebox.showerror("Connection Failed", 
                     "SSH connection failed. Please make sure:\n\n"
                     "1. You've generated an SSH key\n"
@@ -1344,125 +1901,180 @@ chmod 600 ~/.ssh/authorized_keys"""
                     "4. Your Pi is reachable on the network")
         
         except subprocess.TimeoutExpired:
-            self.ssh_status_label.config(text="Status: ✗ Connection timeout", fg=self.colors['danger'])
+            self.ssh_status_label.config(text="Status: ✗ Connection timeout", fg=C.danger)
             messagebox.showerror("Timeout", "Connection timed out. Is your Pi reachable?")
         except Exception as e:
-            self.ssh_status_label.config(text="Status: ✗ Error occurred", fg=self.colors['danger'])
+            self.ssh_status_label.config(text="Status: ✗ Error occurred", fg=C.danger)
             messagebox.showerror("Error", f"Error testing connection:\n{e}")
     
     def _copy_wigle(self):
         if not self._require_pi(): return
         self.txt_pull_log.delete('1.0', 'end')
-        threading.Thread(target=self._copy_wigle_thread, daemon=True).start()
+        self._submit(self._copy_wigle_thread)
     
-    def _copy_wigle_thread(self):
+    def _copy_wigle_thread(self, manifest=False, rsync=True):
+        """Pull the Pi's wiglecsv files into win_dir (plus a sha256 manifest when asked); returns True on success.
+        rsync=False goes straight to the tar stream (the caller already saw rsync fail)."""
         try:
             pi, wd = f"{self.config['pi_user']}@{self.config['pi_host']}", Path(self.config['win_dir'])
-            mr, ar, ml, al = "/tmp/w.sha256", "/tmp/w.tgz", wd / "w.sha256", wd / "w.tgz"
-            self.progress['maximum'], self.progress['value'] = 4, 0
-            self._log("Creating manifest...")
-            self._ssh(f"cd '{self.config['pi_dir']}'; find . -type f -name '*.wiglecsv' -print0 | sort -z | xargs -0 sha256sum > '{mr}'")
-            self.progress['value'] = 1
-            self._log("Packing...")
-            self._ssh(f"cd '{self.config['pi_dir']}'; find . -type f -name '*.wiglecsv' -print0 | tar --null -T - -czf '{ar}'")
-            self.progress['value'] = 2
-            self._log("Copying...")
-            subprocess.run(['scp', f"{pi}:{ar}", str(al)])
-            subprocess.run(['scp', f"{pi}:{mr}", str(ml)])
-            self.progress['value'] = 3
-            self._log("Extracting...")
-            with tarfile.open(al, 'r:gz') as tar:
-                tar.extractall(wd)
-            self.progress['value'] = 4
+            ml = wd / "w.sha256"
+            wd.mkdir(parents=True, exist_ok=True)
+            self._ui(self.progress.config, {'maximum': 4, 'value': 0})
+            rsync = rsync and shutil.which('rsync')
+            if manifest and rsync:
+                self._log("Creating manifest...")
+                r = self._ssh(f"find . -type f -name '*.wiglecsv' -print0 | {{ {PI_HASH}; }}", check=True, cd=True)
+                ml.write_text(r.stdout)  # the manifest comes back on stdout: nothing staged on the Pi, no scp round trip
+            self._ui(self.progress.config, {'value': 1})
+            if rsync and self._rsync_pull(f"{pi}:{self.config['pi_dir'].rstrip('/')}/", wd) == 0:
+                self._log("Synced with rsync")
+            else:
+                # No rsync on either end: stream one tarball over ssh straight into the extractor (no temp archive).
+                # A system tar (bsdtar ships as tar.exe on Windows 10+) inflates and writes in its own process, in C,
+                # alongside the ssh receive; tarfile is the fallback.
+                in_tar = manifest and not rsync  # else the manifest was already fetched above
+                self._log("Copying (with manifest)..." if in_tar else "Copying...")
+                procs, stream, comp = self._pi_tar_stream(manifest=in_tar)
+                with stream:
+                    if tar_bin := shutil.which('tar'):
+                        if rc := subprocess.run([tar_bin, '-xzf' if comp else '-xf', '-', '-C', str(wd)], stdin=stream, **SUBPROC_KW).returncode:
+                            for p in procs: p.kill()
+                            raise RuntimeError(f"local tar exited with {rc}")
+                    else:
+                        with tarfile.open(fileobj=stream, mode=f'r|{comp}') as tar:
+                            tar.extractall(wd, **({'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}))
+                if rc := _wait_all(procs): raise RuntimeError(f"remote tar exited with {rc}")
+                if in_tar: (wd / MANIFEST_MEMBER).replace(ml)  # missing if hashing failed on the Pi: then nothing is verified or deleted
+                self._ui(self.progress.config, {'value': 3})
+            self._ui(self.progress.config, {'value': 4})
             self._log("Complete")
             self._set_status("Transfer complete.")
             self._reset_progress()
-            self.root.after(0, self._refresh_upload_list)
+            self._ui(lambda: self._refresh_upload_list(reuse=True))
+            return True
         except Exception as e:
             self._log(f"ERROR: {e}")
             self._set_status("Failed.")
             self._reset_progress()
+            return False
     
+    def _rsync_pull(self, src, dst, remove_source=False):
+        """rsync only the wiglecsv files from src that dst doesn't already have; progress maps onto steps 1-3.
+        With remove_source, files are compared by checksum and deleted on the Pi once rsync has verified the copy."""
+        self._log("Syncing with rsync...")
+        extra = ['--checksum', '--remove-source-files'] if remove_source else []
+        try:
+            proc = subprocess.Popen(['rsync', '-azs', '--partial', '--info=progress2', '--prune-empty-dirs', *extra,
+                                     '-e', ' '.join(['ssh', *SSH_OPTS]),
+                                     '--include=*/', '--include=*.wiglecsv', '--exclude=*', src, f"{dst}/"],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, **SUBPROC_KW)
+        except OSError:
+            return -1
+        last = None
+        for line in proc.stdout:  # progress2 ends updates with \r, which text mode splits on
+            # rsync prints several updates a second; only a changed percentage is worth a Tk call
+            if (m := RSYNC_PERCENT.search(line)) and (pct := int(m.group(1))) != last:
+                last = pct
+                self._ui(self.progress.config, {'value': 1 + pct / 50})
+        return proc.wait()
+
     def _delete_wigle(self):
         if not self._require_pi() or not messagebox.askyesno("Confirm", "Delete ALL .wiglecsv on Pi?"): return
         self.txt_pull_log.delete('1.0', 'end')
+        self._submit(self._delete_wigle_thread)
+
+    def _delete_wigle_thread(self):
         try:
-            self._ssh(f"cd '{self.config['pi_dir']}'; find . -type f -name '*.wiglecsv' -delete")
-            self._log("Complete")
+            # One remote find -delete for every file (not an rm per file)
+            r = self._ssh("find . -type f -name '*.wiglecsv' -delete", cd=True)
+            self._log("Complete" if r.returncode == 0 else f"ERROR: {r.stderr.strip() or f'ssh exited with {r.returncode}'}")
         except Exception as e:
             self._log(f"ERROR: {e}")
     
     def _automatic(self):
         if not self._require_pi(): return
+        self._ensure_tab(self.tab_rpi)
         self.txt_pull_log.delete('1.0', 'end')
-        threading.Thread(target=self._automatic_thread, daemon=True).start()
+        self._submit(self._automatic_thread)
     
     def _automatic_thread(self):
         try:
             self._log("Stopping Kismet...")
-            self._ssh("sudo systemctl stop kismet")
-            self._copy_wigle_thread()
+            self._ssh(['sudo', 'systemctl', 'stop', 'kismet'])
             wd, ml = Path(self.config['win_dir']), Path(self.config['win_dir']) / "w.sha256"
+            if shutil.which('rsync'):
+                # rsync verifies every transferred file itself, so it can delete on the Pi without a manifest pass
+                self._ui(self.progress.config, {'maximum': 4, 'value': 1})
+                src = f"{self.config['pi_user']}@{self.config['pi_host']}:{self.config['pi_dir'].rstrip('/')}/"
+                if self._rsync_pull(src, wd, remove_source=True) == 0:
+                    self._log("Complete (copied, verified and removed from the Pi by rsync)")
+                    self._set_status("Done.")
+                    self._reset_progress()
+                    self._ui(lambda: self._refresh_upload_list(reuse=True))
+                    return
+                self._log("rsync failed, falling back to copy + verify")
+            if not self._copy_wigle_thread(manifest=True, rsync=False):  # rsync was tried above if there is one
+                self._set_status("Copy failed; nothing deleted on the Pi.")
+                return
             self._log("Verifying...")
-            bad = []
-            for line in ml.read_text().strip().split('\n'):
-                if not line: continue
-                exp, rel = line[:64], line[66:].strip().lstrip('./')
-                lp = wd / rel
-                if not lp.exists():
-                    bad.append(f"MISSING: {rel}")
-                elif hashlib.sha256(lp.read_bytes()).hexdigest().lower() != exp.lower():
-                    bad.append(f"MISMATCH: {rel}")
+            # Manifest lines are "<hex digest>  ./<path>"; the digest length says which tool wrote it (128 = b2sum, 64 = sha256sum)
+            jobs = [(digest.lower(), rel.removeprefix('./')) for digest, _, rel in (line.partition('  ') for line in ml.read_text().splitlines()) if rel]
+            def verify(job):
+                exp, rel = job
+                try: return None if _file_digest(wd / rel, 'blake2b' if len(exp) == 128 else 'sha256') == exp else f"MISMATCH: {rel}"
+                except FileNotFoundError: return f"MISSING: {rel}"
+            # Hashing is file I/O plus GIL-free hashlib work, so a few threads overlap reads across files
+            with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as pool:
+                bad = [r for r in pool.map(verify, jobs) if r]
             if bad:
                 self._log("FAILED (not deleting):")
                 for b in bad: self._log(b)
                 self._set_status("Verification failed.")
                 return
-            self._log("OK. Deleting...")
-            self._ssh(f"cd '{self.config['pi_dir']}'; find . -type f -name '*.wiglecsv' -delete")
+            # Delete exactly what was verified, not whatever find sees now; batched so one ssh call covers many files
+            self._log(f"OK. Deleting {len(jobs)} verified file(s)...")
+            paths = [rel for _, rel in jobs]
+            failed = [r.stderr.strip() for i in range(0, len(paths), 1000)
+                      if (r := self._ssh(['rm', '-f', '--', *paths[i:i + 1000]], cd=True)).returncode]
+            for err in failed: self._log(f"  ✗ Delete on RPi failed: {err}")
             self._log("Complete")
-            self._set_status("Done.")
+            self._set_status("Done." if not failed else "Done, but some files were not deleted on the Pi.")
             self._reset_progress()
         except Exception as e:
             self._log(f"ERROR: {e}")
             self._set_status("Failed.")
     
+    def _pi_command(self, cmd, status):
+        """Send a one-shot command to the Pi from the worker pool; status is shown once ssh returns"""
+        self._submit(self._ssh, cmd, on_done=lambda f: self._set_status(f"Error: {f.exception()}" if f.exception() else status))
+    
     def _restart_kismet(self):
-        if self._require_pi():
-            self._ssh("sudo systemctl restart kismet")
-            self._set_status("Kismet restarted.")
+        if self._require_pi(): self._pi_command(['sudo', 'systemctl', 'restart', 'kismet'], "Kismet restarted.")
     
     def _start_kismet(self):
-        if self._require_pi():
-            self._ssh("sudo systemctl start kismet")
-            self._set_status("Kismet started.")
+        if self._require_pi(): self._pi_command(['sudo', 'systemctl', 'start', 'kismet'], "Kismet started.")
     
     def _stop_kismet(self):
-        if self._require_pi():
-            self._ssh("sudo systemctl stop kismet")
-            self._set_status("Kismet stopped.")
+        if self._require_pi(): self._pi_command(['sudo', 'systemctl', 'stop', 'kismet'], "Kismet stopped.")
     
     def _reboot_pi(self):
         if self._require_pi() and messagebox.askyesno("Confirm", "Reboot the Raspberry Pi?"):
-            self._ssh("sudo reboot")
-            self._set_status("Reboot command sent.")
+            self._pi_command(['sudo', 'reboot'], "Reboot command sent.")
     
     def _shutdown_pi(self):
         if self._require_pi() and messagebox.askyesno("Confirm", "Shutdown Pi?"):
-            self._ssh("sudo shutdown -h now")
-            self._set_status("Shutdown sent.")
+            self._pi_command(['sudo', 'shutdown', '-h', 'now'], "Shutdown sent.")
     
     def _upload_direct_to_wigle(self):
         if not self._require_pi() or not self._require_wigle(): return
         if not messagebox.askyesno("Confirm", "Upload all .wiglecsv files directly from RPi to WiGLE, then delete them from RPi?"): return
+        self._ensure_tab(self.tab_rpi)
         self.txt_pull_log.delete('1.0', 'end')
-        threading.Thread(target=self._upload_direct_thread, daemon=True).start()
+        self._submit(self._upload_direct_thread)
     
     def _upload_direct_thread(self):
         try:
-            pi, wd = f"{self.config['pi_user']}@{self.config['pi_host']}", Path(self.config['win_dir'])
-            wd.mkdir(parents=True, exist_ok=True)
-            token = self.config_mgr.decrypt_token(self.config['wigle_api_token_enc'])
+            token = self._get_wigle_token()
             if not token:
                 self._log("ERROR: Token decrypt failed.")
                 self._set_status("Token decrypt failed.")
@@ -1470,12 +2082,13 @@ chmod 600 ~/.ssh/authorized_keys"""
             
             # Stop Kismet
             self._log("Stopping Kismet...")
-            self._ssh("sudo systemctl stop kismet")
+            self._ssh(['sudo', 'systemctl', 'stop', 'kismet'])
             
             # Get list of files
             self._log("Getting file list from RPi...")
-            result = self._ssh(f"cd '{self.config['pi_dir']}'; find . -type f -name '*.wiglecsv' -print")
-            files = [f.strip().lstrip('./') for f in result.stdout.strip().split('\n') if f.strip()]
+            result = self._ssh("find . -type f -name '*.wiglecsv' -print0", cd=True)
+            # NUL-separated: one C-level split, and names with newlines or leading dots survive intact
+            files = [f[2:] if f.startswith('./') else f for f in result.stdout.split('\0') if f]
             
             if not files:
                 self._log("No .wiglecsv files found on RPi.")
@@ -1483,50 +2096,62 @@ chmod 600 ~/.ssh/authorized_keys"""
                 return
             
             self._log(f"Found {len(files)} file(s) to upload")
-            self.progress['maximum'] = len(files)
-            self.progress['value'] = 0
+            self._ui(self.progress.config, {'maximum': len(files), 'value': 0})
             
-            uploaded = []
-            for remote_file in files:
-                remote_path = f"{self.config['pi_dir']}/{remote_file}"
-                local_file = wd / f"temp_{Path(remote_file).name}"
-                
-                self._log(f"Downloading {remote_file}...")
-                self._set_status(f"Downloading {Path(remote_file).name}...")
-                subprocess.run(['scp', f"{pi}:{remote_path}", str(local_file)])
-                
-                self._log(f"Uploading to WiGLE...")
-                self._set_status(f"Uploading {Path(remote_file).name} to WiGLE...")
+            auth = (self.config['wigle_api_id'], token)  # one auth tuple for every POST on the shared session
+            uploaded, lock, advance = [], threading.Lock(), self._progress_stepper()
+            # Pipeline: one thread pulls files off the Pi while UPLOAD_WORKERS post the ones already here;
+            # the bounded queue keeps at most a few gzipped bodies (spooled in RAM) waiting at a time
+            staged = queue.Queue(maxsize=4)
+
+            def download():
+                # One ssh channel streams every file as a tar; each member is gzipped straight into a spool
+                # as it arrives, so nothing is written to win_dir and read back
                 try:
-                    with open(local_file, 'rb') as f:
-                        r = requests.post("https://api.wigle.net/api/v2/file/upload", 
-                            auth=(self.config['wigle_api_id'], token),
-                            headers={'Accept': 'application/json'}, 
-                            files={'file': f})
-                    resp = r.json()
-                    if 'transid' in resp:
-                        self._log(f"  ✓ Uploaded successfully (TransID: {resp['transid']})")
-                        uploaded.append(remote_path)
-                    else:
-                        self._log(f"  ✓ Uploaded (no TransID returned)")
-                        uploaded.append(remote_path)
+                    procs, stream, comp = self._pi_tar_stream()
+                    with stream, tarfile.open(fileobj=stream, mode=f'r|{comp}') as tar:
+                        for member in tar:
+                            if not member.isfile(): continue
+                            remote_file = member.name[2:] if member.name.startswith('./') else member.name
+                            self._log(f"Downloading {remote_file}...")
+                            with tar.extractfile(member) as src:
+                                body = _gzip_spool(src)
+                            staged.put((remote_file, f"{self.config['pi_dir']}/{remote_file}", body))
+                    if rc := _wait_all(procs): self._log(f"  ✗ Download from RPi ended early (exit {rc})")
                 except Exception as e:
-                    self._log(f"  ✗ Upload failed: {e}")
-                
-                # Clean up local temp file
-                try:
-                    local_file.unlink()
-                except:
-                    pass
-                
-                self.progress['value'] += 1
+                    self._log(f"  ✗ Download failed: {e}")
+                finally:
+                    for _ in range(UPLOAD_WORKERS): staged.put(None)
+
+            def upload():
+                while (job := staged.get()) is not None:
+                    remote_file, remote_path, body = job
+                    self._set_status(f"Uploading {Path(remote_file).name} to WiGLE...")
+                    try:
+                        resp = self._post_wigle_file(body, auth, Path(remote_file).name)
+                        if 'transid' in resp:
+                            self._log(f"  ✓ Uploaded {remote_file} (TransID: {resp['transid']})")
+                        else:
+                            self._log(f"  ✓ Uploaded {remote_file} (no TransID returned)")
+                        with lock: uploaded.append(remote_path)
+                    except Exception as e:
+                        self._log(f"  ✗ Upload of {remote_file} failed: {e}")
+                    finally:
+                        body.close()  # no-op if the post already closed it
+                    advance()
+
+            with ThreadPoolExecutor(max_workers=1 + UPLOAD_WORKERS) as pool:
+                jobs = [pool.submit(download)] + [pool.submit(upload) for _ in range(UPLOAD_WORKERS)]
+                for job in jobs: job.result()
             
             # Delete uploaded files from RPi
             if uploaded:
                 self._log(f"\nDeleting {len(uploaded)} uploaded file(s) from RPi...")
-                for remote_path in uploaded:
-                    self._ssh(f"rm -f '{remote_path}'")
-                self._log("Cleanup complete")
+                # One ssh round trip per 1000 paths rather than per file (the batch keeps well under ARG_MAX)
+                failed = [r.stderr.strip() for i in range(0, len(uploaded), 1000)
+                          if (r := self._ssh(['rm', '-f', '--', *uploaded[i:i + 1000]])).returncode]
+                for err in failed: self._log(f"  ✗ Delete on RPi failed: {err}")
+                self._log(f"Cleanup failed for {len(failed)} batch(es); those files are still on the RPi" if failed else "Cleanup complete")
             
             self._log(f"\nDone! Uploaded {len(uploaded)} of {len(files)} file(s)")
             self._set_status("Upload complete.")
@@ -1537,36 +2162,70 @@ chmod 600 ~/.ssh/authorized_keys"""
             self._set_status("Upload failed.")
             self._reset_progress()
     
-    def _refresh_upload_list(self):
-        self.tree_upload.delete(*self.tree_upload.get_children())
-        self.upload_checks = {}
-        for fp in sorted(Path(self.config['win_dir']).rglob('*.wiglecsv')):
-            item = self.tree_upload.insert('', 'end', text='☐', values=(str(fp), self._fmt_bytes(fp.stat().st_size), 'Ready', ''))
-            self.upload_checks[item] = False
-        self._set_status(f"Found {len(self.upload_checks)} files")
+    def _refresh_upload_list(self, announce=True, reuse=False):
+        """Rescan win_dir on a worker and load the rows into the tree; announce=False keeps the caller's status text.
+        With reuse, a listing identical to the one on screen leaves the tree (and its checks/statuses) untouched."""
+        if not self._tab_built[self.tab_upload]: return
+        scan = self._upload_scan = object()  # only the latest scan may fill the tree
+        def done(fut):
+            if scan is not self._upload_scan or fut.exception(): return
+            rows = fut.result()
+            if not (reuse and rows == self._upload_rows):
+                self._upload_rows = rows
+                self.upload_checks = dict.fromkeys(self.tree_upload.load(rows, ('unchecked',)), False)
+            if announce: self._set_status(f"Found {len(self.upload_checks)} files")
+        self._submit(self._scan_upload_rows, self.config['win_dir'], on_done=done)
+
+    def _scan_upload_rows(self, win_dir):
+        return [(fp, self._fmt_bytes(size), 'Ready', '') for fp, size in sorted(_iter_files(win_dir, '.wiglecsv'))]
+    
+    def _post_wigle_file(self, src, auth, name=None):
+        """Upload one capture (path, file object or ready _gzip_spool) to WiGLE gzipped as <name>.gz;
+        streamed from the spool when requests-toolbelt is present"""
+        with (src if isinstance(src, tempfile.SpooledTemporaryFile) else _gzip_spool(src)) as body:
+            part = (f"{name or Path(src).name}.gz", body, 'application/gzip')
+            headers = {'Accept': 'application/json'}
+            if MultipartEncoder:
+                # toolbelt sizes file parts through fileno(), which rolls a spool still in RAM over to disk;
+                # until it has rolled over, give it the spool's own BytesIO instead (already rewound)
+                enc = MultipartEncoder(fields={'file': part if body._rolled else (part[0], body._file, part[2])})
+                headers['Content-Type'] = enc.content_type
+                r = self.http.post(WIGLE_UPLOAD_URL, auth=auth, headers=headers, data=enc, timeout=UPLOAD_TIMEOUT)
+            else:
+                r = self.http.post(WIGLE_UPLOAD_URL, auth=auth, headers=headers, files={'file': part}, timeout=UPLOAD_TIMEOUT)
+        # An error status or a JSON rejection must raise, so the caller neither marks the file uploaded nor deletes it
+        r.raise_for_status()
+        resp = _json_loads(r.content)
+        if isinstance(resp, dict) and resp.get('success') is False:
+            raise RuntimeError(resp.get('message') or "WiGLE rejected the upload")
+        return resp
     
     def _upload_files(self):
         if not self._require_wigle(): return
-        token = self.config_mgr.decrypt_token(self.config['wigle_api_token_enc'])
-        if not token: return self._set_status("Token decrypt failed.")
         items = [i for i, c in self.upload_checks.items() if c]
         if not items: return
-        self.progress['maximum'], self.progress['value'] = len(items), 0
-        for item in items:
-            fp = self.tree_upload.item(item)['values'][0]
-            self.tree_upload.set(item, 'Status', 'Uploading...')
-            self.root.update_idletasks()
+        jobs = [(item, self.tree_upload.item(item)['values'][0]) for item in items]
+        self.progress['maximum'], self.progress['value'] = len(jobs), 0
+        self._submit(self._upload_files_thread, jobs)
+
+    def _upload_files_thread(self, jobs):
+        """Worker: post the (item, path) jobs to WiGLE UPLOAD_WORKERS at a time on the shared session"""
+        token = self._get_wigle_token()
+        if not token: return self._set_status("Token decrypt failed.")
+        auth, step = (self.config['wigle_api_id'], token), self._progress_stepper()
+        def upload(job):
+            item, fp = job
+            self._ui(self.tree_upload.set, item, 'Status', 'Uploading...')
             try:
-                with open(fp, 'rb') as f:
-                    r = requests.post("https://api.wigle.net/api/v2/file/upload", auth=(self.config['wigle_api_id'], token),
-                        headers={'Accept': 'application/json'}, files={'file': f})
-                resp = r.json()
-                self.tree_upload.set(item, 'Status', 'Uploaded')
+                resp = self._post_wigle_file(fp, auth)
+                self._ui(self.tree_upload.set, item, 'Status', 'Uploaded')
                 if 'transid' in resp:
-                    self.tree_upload.set(item, 'TransID', resp['transid'])
+                    self._ui(self.tree_upload.set, item, 'TransID', resp['transid'])
             except:
-                self.tree_upload.set(item, 'Status', 'FAILED')
-            self.progress['value'] += 1
+                self._ui(self.tree_upload.set, item, 'Status', 'FAILED')
+            step()
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+            list(pool.map(upload, jobs))
         self._set_status("Upload complete.")
         self._reset_progress()
     
@@ -1583,64 +2242,112 @@ chmod 600 ~/.ssh/authorized_keys"""
         if not items: return
         zp = Path(self.config['win_dir']) / f"{datetime.now().strftime('%Y-%m-%d')}.zip"
         if zp.exists() and not messagebox.askyesno("Confirm", f"Overwrite {zp.name}?"): return
+        paths = [Path(self.tree_upload.item(item)['values'][0]) for item in items]
+        self.progress['maximum'], self.progress['value'] = len(paths), 0
+        self._set_status(f"Archiving {len(paths)} file(s)...")
+        def done(fut):
+            self._reset_progress()
+            self._refresh_upload_list(announce=False)
+            self._set_status(f"Archive failed: {fut.exception()}" if fut.exception() else f"Archived to {zp.name} and deleted source files")
+        self._submit(self._archive_thread, zp, paths, on_done=done)
+
+    def _archive_thread(self, zp, paths):
+        """Worker: deflate paths into zp, then delete the sources that made it into the archive"""
         files_to_delete = []
-        with zipfile.ZipFile(zp, 'w') as zf:
-            for item in items:
-                if (fp := Path(self.tree_upload.item(item)['values'][0])).exists():
+        self._dir_mtime_cache.pop((self.config['win_dir'], '.zip'), None)  # an overwrite changes size, not the dir mtime
+        # Level 1 deflate: CSV still shrinks several-fold at a fraction of the default level's CPU time
+        with zipfile.ZipFile(zp, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            for i, fp in enumerate(paths, 1):
+                if fp.exists():
                     zf.write(fp, fp.name)
                     files_to_delete.append(fp)
+                self._ui(self.progress.config, {'value': i})
         # Delete the source files after successful archiving
         for fp in files_to_delete:
             try:
                 fp.unlink()
             except Exception as e:
                 self._log(f"Warning: Could not delete {fp.name}: {e}")
-        self._refresh_upload_list()
-        self._set_status(f"Archived to {zp.name} and deleted source files")
     
     def _find_transactions(self):
         if not self._require_wigle(): return
-        self.tree_tx.delete(*self.tree_tx.get_children())
-        self.tx_checks = {}
+        self.tx_checks = dict.fromkeys(self.tree_tx.load([]), False)
         start, end = self.txt_start.get().strip(), self.txt_end.get().strip()
         if len(start) != 8 or len(end) != 8: return self._set_status("Invalid date format.")
-        try:
-            token = self.config_mgr.decrypt_token(self.config['wigle_api_token_enc'])
-            r = requests.get("https://api.wigle.net/api/v2/file/transactions?pagestart=0", auth=(self.config['wigle_api_id'], token))
-            for tx in r.json()['results']:
-                if (tid := tx.get('transid', '')) and len(tid) >= 8 and start <= (date := tid[:8]) <= end:
-                    dl = (Path(self.config['wigle_out_dir']) / f"{tid}.kml").exists()
-                    item = self.tree_tx.insert('', 'end', text='☐', values=(tid, date, 'Downloaded' if dl else 'New', '', ''))
-                    self.tx_checks[item] = False
+        self._set_status("Searching transactions...")
+        def done(fut):
+            if fut.exception(): return self._set_status(f"Error: {fut.exception()}")
+            self.tx_checks = dict.fromkeys(self.tree_tx.load(fut.result(), ('unchecked',)), False)
             self._set_status(f"Found {len(self.tx_checks)} transactions")
-        except Exception as e:
-            self._set_status(f"Error: {e}")
+        self._submit(self._search_transactions, start, end, on_done=done)
+
+    def _search_transactions(self, start, end):
+        """Worker: tree rows for the transactions dated start..end (YYYYMMDD), paging newest-first until past start"""
+        token, rows, have = self._get_wigle_token(), [], _kml_ids(self.config['wigle_out_dir'])
+        pagestart = 0
+        while (results := self._tx_page(token, pagestart)):
+            for tx in results:
+                if (tid := tx.get('transid', '')) and len(tid) >= 8 and start <= (date := tid[:8]) <= end:
+                    rows.append((tid, date, 'Downloaded' if tid in have else 'New', '', ''))
+            if len(results) < TX_PAGE or results[-1].get('transid', '')[:8] < start: break
+            pagestart += TX_PAGE
+        return rows
+
+    def _tx_page(self, token, pagestart=0):
+        """One page of the user's WiGLE transactions; a page the server reports unchanged (304) is reused from _tx_pages"""
+        etag, cached = self._tx_pages.get(pagestart, (None, None))
+        headers = {'Accept': 'application/json', **({'If-None-Match': etag} if etag else {})}
+        r = self.http.get(WIGLE_TX_URL, params={'pagestart': pagestart, 'pagebuffer': TX_PAGE},
+                          auth=(self.config['wigle_api_id'], token), headers=headers, timeout=HTTP_TIMEOUT)
+        if r.status_code == 304 and cached is not None: return cached
+        r.raise_for_status()
+        results = _json_loads(r.content).get('results') or []
+        if (etag := r.headers.get('ETag')): self._tx_pages[pagestart] = (etag, results)
+        return results
     
     def _tx_download_new(self):
-        for item, checked in self.tx_checks.items():
-            if self.tree_tx.item(item)['values'][2] == 'New':
-                self.tx_checks[item] = True
-                self.tree_tx.item(item, text='☑')
+        flip = [item for item, checked in self.tx_checks.items() if not checked and self.tree_tx.item(item)['values'][2] == 'New']
+        self.tx_checks.update(dict.fromkeys(flip, True))
+        self.tree_tx.retag(flip, 'checked', 'unchecked')
     
     def _tx_download_selected(self):
         if not self._require_wigle(): return
         items = [i for i, c in self.tx_checks.items() if c]
         if not items: return
-        token = self.config_mgr.decrypt_token(self.config['wigle_api_token_enc'])
-        self.progress['maximum'], self.progress['value'] = len(items), 0
+        out, have = Path(self.config['wigle_out_dir']), _kml_ids(self.config['wigle_out_dir'])
+        pending = []
         for item in items:
-            tid = self.tree_tx.item(item)['values'][0]
-            fp = Path(self.config['wigle_out_dir']) / f"{tid}.kml"
-            if fp.exists():
-                self.progress['value'] += 1
-                continue
+            tid = str(self.tree_tx.item(item)['values'][0])
+            if tid not in have: pending.append((item, tid, out / f"{tid}.kml"))
+        skipped = len(items) - len(pending)
+        self.progress['maximum'], self.progress['value'] = len(items), skipped
+        self._submit(self._tx_download_thread, pending, skipped)
+
+    def _tx_download_thread(self, pending, skipped=0):
+        """Worker: stream the pending (item, tid, path) KMLs to disk over KML_WORKERS parallel keep-alive GETs"""
+        auth = (self.config['wigle_api_id'], self._get_wigle_token())
+        step = self._progress_stepper(skipped)
+        def download(job):
+            item, tid, fp = job
+            tmp = fp.with_suffix('.kml.part')
             try:
-                r = requests.get(f"https://api.wigle.net/api/v2/file/kml/{tid}", auth=(self.config['wigle_api_id'], token))
-                fp.write_bytes(r.content)
-                self.tree_tx.set(item, 'Status', 'Downloaded')
-            except: pass
-            self.progress['value'] += 1
-        self._set_status("Download complete.")
+                with self.http.get(f"https://api.wigle.net/api/v2/file/kml/{tid}", auth=auth, stream=True, timeout=HTTP_TIMEOUT) as r:
+                    r.raise_for_status()
+                    with tmp.open('wb') as f:
+                        for block in r.iter_content(64 * 1024): f.write(block)
+                tmp.replace(fp)  # no half-written .kml if the download dies
+                self._ui(self.tree_tx.set, item, 'Status', 'Downloaded')
+                return True
+            except Exception:
+                self._ui(self.tree_tx.set, item, 'Status', 'Failed')
+                try: tmp.unlink()
+                except: pass
+                return False
+            finally:
+                step()
+        with ThreadPoolExecutor(max_workers=KML_WORKERS) as pool:
+            failed = sum(not ok for ok in pool.map(download, pending))
+        self._set_status(f"Download complete ({failed} failed)." if failed else "Download complete.")
         self._reset_progress()
 
 